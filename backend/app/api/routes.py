@@ -1,14 +1,23 @@
 """
 API routes for TruthLens
 """
+import asyncio
 import hashlib
 import json
+import re
+import time
+from collections import OrderedDict
 from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import orjson
 from fastapi import APIRouter, HTTPException
-from app.models.schemas import ProductInput, ProductAnalysis, HealthCheck
+from fastapi.responses import Response
+from app.models.schemas import (
+    ProductInput, ProductData, ProductAnalysis, BatchAnalysisItem, HealthCheck
+)
 from app.core.scraper import ProductScraper
 from app.core.nlp_extractor import ClaimExtractor
-from app.core.feasibility import FeasibilityEngine
+from app.core.feasibility import get_engine
 from app.core.pricing import PricingEngine
 from app.core.scoring import ScoringEngine
 
@@ -17,12 +26,47 @@ router = APIRouter()
 # Initialize core modules (singleton instances for caching)
 scraper = ProductScraper()
 claim_extractor = ClaimExtractor()
-feasibility_engine = FeasibilityEngine()
+feasibility_engine = get_engine()
 pricing_engine = PricingEngine()
 scoring_engine = ScoringEngine()
 
-# Simple in-memory cache for analysis results
-_analysis_cache = {}
+# In-memory LRU cache for analysis results, kept with their serialized JSON
+_analysis_cache: "OrderedDict[str, Tuple[ProductAnalysis, bytes]]" = OrderedDict()
+_CACHE_MAX = 100
+
+# Failed URL scrapes, remembered briefly so retries fail fast
+_error_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_ERROR_TTL = 60  # seconds
+
+# Analyses currently running, so identical concurrent requests share one
+_inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+
+# Maximum number of products accepted by /analyze-batch
+MAX_BATCH_SIZE = 10
+
+# First number in a claim passed to /verify-claim
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+
+@router.on_event("startup")
+async def start_browser_pool():
+    """Launch the shared scraping browser once instead of per request"""
+    try:
+        from app.core.browser_scraper import browser_pool, on_scraper_loop
+        await on_scraper_loop(browser_pool.startup())
+    except Exception:
+        # Playwright/Chromium not installed - scraper falls back to requests
+        pass
+
+
+@router.on_event("shutdown")
+async def stop_browser_pool():
+    """Close the shared scraping browser"""
+    try:
+        from app.core.browser_scraper import browser_pool, on_scraper_loop
+        await on_scraper_loop(browser_pool.shutdown())
+    except Exception:
+        pass
 
 
 @router.get("/health", response_model=HealthCheck)
@@ -31,6 +75,164 @@ async def health():
     return HealthCheck(status="healthy", version="1.0.0")
 
 
+def _validate_input(product_input: ProductInput) -> None:
+    """Reject empty, ambiguous or badly sized input"""
+    if not product_input.url and not product_input.text:
+        raise HTTPException(
+            status_code=400,
+            detail="❌ Either 'url' or 'text' must be provided. Please enter product details."
+        )
+    
+    if product_input.url and product_input.text:
+        raise HTTPException(
+            status_code=400,
+            detail="⚠️ Provide either URL or text, not both."
+        )
+    
+    if product_input.text and len(product_input.text.strip()) < 10:
+        raise HTTPException(
+            status_code=400,
+            detail="❌ Product description too short. Please provide at least 10 characters."
+        )
+    
+    if product_input.text and len(product_input.text) > 10000:
+        raise HTTPException(
+            status_code=400,
+            detail="⚠️ Product description too long. Please limit to 10,000 characters."
+        )
+
+
+def _cache_key(product_input: ProductInput) -> str:
+    """Generate cache key from input (full text, so long inputs never collide)"""
+    if product_input.url:
+        source = b'url:' + product_input.url.encode()
+    else:
+        source = b'text:' + product_input.text.encode()
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _cache_get(cache_key: str) -> Optional[Tuple[ProductAnalysis, bytes]]:
+    """Return cached (analysis, JSON body) and mark it most recently used"""
+    entry = _analysis_cache.get(cache_key)
+    if entry is not None:
+        _analysis_cache.move_to_end(cache_key)
+    return entry
+
+
+def _cache_result(cache_key: str, analysis: ProductAnalysis) -> bytes:
+    """Serialize and store analysis, evicting the least recently used entry when full"""
+    body = orjson.dumps(analysis.model_dump())
+    _analysis_cache[cache_key] = (analysis, body)
+    _analysis_cache.move_to_end(cache_key)
+    
+    if len(_analysis_cache) > _CACHE_MAX:
+        _analysis_cache.popitem(last=False)
+    return body
+
+
+def _json_response(body: bytes) -> Response:
+    """Send already-serialized JSON as is"""
+    return Response(content=body, media_type="application/json")
+
+
+def _error_get(cache_key: str) -> Optional[str]:
+    """Return the cached scrape error for this key, if it has not expired"""
+    entry = _error_cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    message, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _error_cache[cache_key]
+        return None
+    return message
+
+
+def _cache_error(cache_key: str, message: str) -> None:
+    """Remember a failed scrape for _ERROR_TTL seconds"""
+    _error_cache[cache_key] = (message, time.monotonic() + _ERROR_TTL)
+    _error_cache.move_to_end(cache_key)
+    
+    if len(_error_cache) > _CACHE_MAX:
+        _error_cache.popitem(last=False)
+
+
+def _run_pipeline(product_data: ProductData) -> ProductAnalysis:
+    """Run claim extraction, verification, pricing and scoring"""
+    # Step 2: Extract claims using NLP
+    claims = claim_extractor.extract_claims(product_data)
+    
+    # Step 3: Verify claim feasibility
+    verifications = feasibility_engine.verify_claims(claims)
+    
+    # Step 4: Analyze pricing
+    price_analysis = pricing_engine.analyze_price(product_data, claims)
+    
+    # Step 5: Generate scores and final analysis
+    return scoring_engine.generate_analysis(
+        product_data,
+        claims,
+        verifications,
+        price_analysis
+    )
+
+
+def _run_batch_pipeline(products: List[ProductData]) -> List:
+    """
+    Run the pipeline for several products, pricing them in one batch call
+    Each entry is a ProductAnalysis, or the exception that product failed with
+    """
+    results: List = [None] * len(products)
+    prepared = []
+    
+    # Steps 2-3 per product, so one bad product doesn't sink the batch
+    for i, product_data in enumerate(products):
+        try:
+            claims = claim_extractor.extract_claims(product_data)
+            verifications = feasibility_engine.verify_claims(claims)
+        except Exception as e:
+            results[i] = e
+            continue
+        prepared.append((i, claims, verifications))
+    
+    # Step 4: Analyze pricing for the whole batch at once
+    price_analyses = pricing_engine.analyze_prices(
+        [products[i] for i, _, _ in prepared],
+        [claims for _, claims, _ in prepared]
+    )
+    
+    # Step 5: Generate scores and final analysis
+    for (i, claims, verifications), price_analysis in zip(prepared, price_analyses):
+        try:
+            results[i] = scoring_engine.generate_analysis(
+                products[i],
+                claims,
+                verifications,
+                price_analysis
+            )
+        except Exception as e:
+            results[i] = e
+    return results
+
+
+async def _analyze_uncached(product_input: ProductInput, cache_key: str) -> bytes:
+    """Scrape and analyze one product, caching the serialized result"""
+    # Step 1: Extract product data (blocking, so off the event loop)
+    if product_input.url:
+        try:
+            product_data = await asyncio.to_thread(scraper.extract_from_url, product_input.url)
+        except ValueError as e:
+            _cache_error(cache_key, str(e))
+            raise
+    else:
+        product_data = await asyncio.to_thread(scraper.extract_from_text, product_input.text)
+    
+    analysis = await asyncio.to_thread(_run_pipeline, product_data)
+    
+    # Cache result, serializing it once for this and later responses
+    return _cache_result(cache_key, analysis)
+
+
 @router.post("/analyze", response_model=ProductAnalysis)
 async def analyze_product(product_input: ProductInput):
     """
@@ -46,80 +248,52 @@ async def analyze_product(product_input: ProductInput):
     """
     try:
         # Input validation
-        if not product_input.url and not product_input.text:
-            raise HTTPException(
-                status_code=400,
-                detail="❌ Either 'url' or 'text' must be provided. Please enter product details."
-            )
+        _validate_input(product_input)
         
-        if product_input.url and product_input.text:
-            raise HTTPException(
-                status_code=400,
-                detail="⚠️ Provide either URL or text, not both."
-            )
+        cache_key = _cache_key(product_input)
         
-        if product_input.text and len(product_input.text.strip()) < 10:
-            raise HTTPException(
-                status_code=400,
-                detail="❌ Product description too short. Please provide at least 10 characters."
-            )
-        
-        if product_input.text and len(product_input.text) > 10000:
-            raise HTTPException(
-                status_code=400,
-                detail="⚠️ Product description too long. Please limit to 10,000 characters."
-            )
+        while True:
+            # Check cache (LRU)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return _json_response(cached[1])
+            
+            # Don't re-scrape a URL that just failed
+            cached_error = _error_get(cache_key)
+            if cached_error is not None:
+                raise HTTPException(status_code=400, detail=cached_error)
+            
+            # Join an identical analysis that is already running
+            inflight = _inflight.get(cache_key)
+            if inflight is None:
+                break
+            try:
+                return _json_response(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                # Only the leader's client went away: look again and take over
+                if not inflight.cancelled():
+                    raise
         
-        # Generate cache key from input
-        if product_input.url:
-            cache_key = hashlib.md5(product_input.url.encode()).hexdigest()
-        else:
-            # Use first 500 chars for cache key
-            cache_key = hashlib.md5(product_input.text[:500].encode()).hexdigest()
-        
-        # Check cache with FIFO eviction
-        if cache_key in _analysis_cache:
-            return _analysis_cache[cache_key]
+        future = asyncio.get_running_loop().create_future()
+        # Waiters re-raise a failure themselves; don't log it as never retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        _inflight[cache_key] = future
+        try:
+            body = await _analyze_uncached(product_input, cache_key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            _inflight.pop(cache_key, None)
         
-        # Evict oldest if cache is full
-        if len(_analysis_cache) >= 100:
-            # Remove first (oldest) item
-            first_key = next(iter(_analysis_cache))
-            del _analysis_cache[first_key]
-        
-        # Step 1: Extract product data
-        if product_input.url:
-            product_data = scraper.extract_from_url(product_input.url)
-        else:
-            product_data = scraper.extract_from_text(product_input.text)
-        
-        # Step 2: Extract claims using NLP
-        claims = claim_extractor.extract_claims(product_data)
-        
-        # Step 3: Verify claim feasibility
-        verifications = feasibility_engine.verify_claims(claims)
-        
-        # Step 4: Analyze pricing
-        price_analysis = pricing_engine.analyze_price(product_data, claims)
-        
-        # Step 5: Generate scores and final analysis
-        analysis = scoring_engine.generate_analysis(
-            product_data,
-            claims,
-            verifications,
-            price_analysis
-        )
-        
-        # Cache result
-        _analysis_cache[cache_key] = analysis
-        
-        # Limit cache size
-        if len(_analysis_cache) > 100:
-            # Remove oldest entry (simple FIFO)
-            _analysis_cache.pop(next(iter(_analysis_cache)))
-        
-        return analysis
+        future.set_result(body)
+        return _json_response(body)
     
+    except HTTPException:
+        raise
     except ValueError as e:
         # User-friendly errors from scraper
         raise HTTPException(status_code=400, detail=str(e))
@@ -130,6 +304,81 @@ async def analyze_product(product_input: ProductInput):
         )
 
 
+@router.post("/analyze-batch", response_model=List[BatchAnalysisItem])
+async def analyze_batch(product_inputs: List[ProductInput]):
+    """
+    Analyze several products in one request
+    
+    URLs are scraped concurrently in a shared browser.
+    Each item gets either an analysis or an error message.
+    """
+    if len(product_inputs) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"⚠️ Too many products. Please limit batches to {MAX_BATCH_SIZE} items."
+        )
+    
+    results: List[BatchAnalysisItem] = [None] * len(product_inputs)
+    cache_keys: List[Optional[str]] = [None] * len(product_inputs)
+    product_data: List = [None] * len(product_inputs)
+    url_indexes = []
+    
+    for i, product_input in enumerate(product_inputs):
+        try:
+            _validate_input(product_input)
+        except HTTPException as e:
+            results[i] = BatchAnalysisItem(error=e.detail)
+            continue
+        
+        cache_keys[i] = _cache_key(product_input)
+        cached = _cache_get(cache_keys[i])
+        cached_error = _error_get(cache_keys[i])
+        if cached is not None:
+            results[i] = BatchAnalysisItem(analysis=cached[0])
+        elif cached_error is not None:
+            results[i] = BatchAnalysisItem(error=cached_error)
+        elif product_input.url:
+            url_indexes.append(i)
+        else:
+            try:
+                product_data[i] = await asyncio.to_thread(
+                    scraper.extract_from_text, product_input.text
+                )
+            except ValueError as e:
+                results[i] = BatchAnalysisItem(error=str(e))
+    
+    # Step 1 for URLs: scrape all of them concurrently
+    if url_indexes:
+        scraped = await scraper.extract_many(
+            [product_inputs[i].url for i in url_indexes]
+        )
+        for i, item in zip(url_indexes, scraped):
+            if isinstance(item, Exception):
+                if isinstance(item, ValueError):
+                    _cache_error(cache_keys[i], str(item))
+                results[i] = BatchAnalysisItem(error=str(item))
+            else:
+                product_data[i] = item
+    
+    # Steps 2-5 for everything scraped, in a single worker thread
+    pending = [i for i, data in enumerate(product_data) if data is not None]
+    if pending:
+        try:
+            analyses = await asyncio.to_thread(
+                _run_batch_pipeline, [product_data[i] for i in pending]
+            )
+        except Exception as e:
+            analyses = [e] * len(pending)
+        for i, analysis in zip(pending, analyses):
+            if isinstance(analysis, Exception):
+                results[i] = BatchAnalysisItem(error=f"Analysis failed: {str(analysis)}")
+                continue
+            _cache_result(cache_keys[i], analysis)
+            results[i] = BatchAnalysisItem(analysis=analysis)
+    
+    return results
+
+
 @router.post("/extract-claims")
 async def extract_claims_only(product_input: ProductInput):
     """
@@ -138,16 +387,16 @@ async def extract_claims_only(product_input: ProductInput):
     """
     try:
         if product_input.url:
-            product_data = scraper.extract_from_url(product_input.url)
+            product_data = await asyncio.to_thread(scraper.extract_from_url, product_input.url)
         elif product_input.text:
-            product_data = scraper.extract_from_text(product_input.text)
+            product_data = await asyncio.to_thread(scraper.extract_from_text, product_input.text)
         else:
             raise HTTPException(
                 status_code=400,
                 detail="Either 'url' or 'text' must be provided"
             )
         
-        claims = claim_extractor.extract_claims(product_data)
+        claims = await asyncio.to_thread(claim_extractor.extract_claims, product_data)
         
         return {
             "product_title": product_data.title,
@@ -179,10 +428,9 @@ async def verify_single_claim(claim_text: str):
         )
         
         # Try to extract value from text
-        import re
-        numbers = re.findall(r'\d+\.?\d*', claim_text)
-        if numbers:
-            claim.extracted_value = float(numbers[0])
+        number = _NUMBER_RE.search(claim_text)
+        if number:
+            claim.extracted_value = float(number.group())
         
         # Verify
         verification = feasibility_engine._verify_single_claim(claim)
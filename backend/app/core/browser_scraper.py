@@ -2,43 +2,320 @@
 Advanced browser-based scraper using Playwright
 Handles JavaScript-heavy sites and bot detection
 """
+import os
 import re
+import time
 import asyncio
-from typing import Dict, Any, Optional
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+import threading
+from concurrent.futures import TimeoutError as FutureTimeout
+from functools import lru_cache
+from typing import Awaitable, Dict, Any, List, Optional, TypeVar, Union
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Playwright,
+    TimeoutError as PlaywrightTimeout
+)
+import httpx
 from bs4 import BeautifulSoup
 from app.models.schemas import ProductData
+from app.utils.html_parsing import (
+    compile_selectors, find_json_ld_product, make_soup, select_grouped
+)
+
+
+# Browser pool tuning (override via environment)
+POOL_MAX_CONTEXTS = int(os.getenv('BROWSER_POOL_MAX', '4'))  # Concurrent pages per browser
+POOL_IDLE_TIMEOUT = float(os.getenv('BROWSER_IDLE_TIMEOUT', '300'))  # Seconds before an idle browser is recycled
+STATIC_FETCH_TIMEOUT = 10.0  # Seconds for the plain HTTP attempt before using the browser
+SYNC_SCRAPE_TIMEOUT = 60.0  # Seconds extract_from_url_sync waits for a result
+
+LAUNCH_ARGS = ['--disable-blink-features=AutomationControlled']
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+EXTRA_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+}
+
+# Only HTML and the scripts that render it matter - skip everything else
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_TRACKER_RE = re.compile(
+    r'doubleclick\.net|googletagmanager\.com|google-analytics\.com|'
+    r'googlesyndication\.com|facebook\.net|connect\.facebook|hotjar\.com|'
+    r'scorecardresearch\.com|criteo\.(?:com|net)|amazon-adsystem\.com'
+)
+
+# All price patterns in one zero-width alternation, so the text is scanned once
+# and a rejected match never hides another pattern's candidate inside it.
+# Group names give preference: p0 is the most trusted, p7 (bare number) the least.
+_PRICE_RE = re.compile(
+    r'(?='
+    r'₹\s*(?P<p0>[0-9,]+\.?[0-9]*)'
+    r'|Rs\.?\s*(?P<p1>[0-9,]+\.?[0-9]*)'
+    r'|INR\s*(?P<p2>[0-9,]+\.?[0-9]*)'
+    r'|MRP[:\s]*₹?\s*(?P<p3>[0-9,]+\.?[0-9]*)'
+    r'|Price[:\s]*₹?\s*(?P<p4>[0-9,]+\.?[0-9]*)'
+    r'|\$\s*(?P<p5>[0-9,]+\.?[0-9]*)'
+    r'|(?:Price|price|Cost:|MRP|mrp)[:\s]*[₹\$€£¥Rs.]?\s*(?P<p6>[0-9,]+\.?[0-9]*)'
+    r'|\b(?P<p7>[0-9]{2,6})\b'
+    r')'
+)
+
+# Currency markers by kind, matched zero-width so overlapping markers all count.
+# 'rs.'/'rs ' stay case-sensitive as Rs/RS often start unrelated words.
+_CURRENCY_RE = re.compile(
+    r'(?='
+    r'(?P<INR>₹|(?i:inr|rupee)|rs\.|rs )'
+    r'|(?P<EUR>€|(?i:eur))'
+    r'|(?P<GBP>£|(?i:gbp))'
+    r'|(?P<USD>\$|(?i:usd))'
+    r')'
+)
+_CURRENCY_PRIORITY = ('INR', 'EUR', 'GBP', 'USD')
+
+# CSS selectors per field, most specific first
+_TITLE_SELECTORS = compile_selectors([
+    'h1[id*="title"]',
+    'h1[id*="productTitle"]',
+    'h1.product-title',
+    'h1[class*="product"]',
+    'h1[data-testid*="title"]',
+    '[data-testid="product-title"]',
+    'h1[class*="title"]',
+    '.product-name h1',
+    '#product-title',
+    'h1'
+])
+_DESCRIPTION_SELECTORS = compile_selectors([
+    '[id*="description"]',
+    '[class*="description"]',
+    '[data-testid*="description"]',
+    'div.product-details',
+    '[id*="feature"]',
+    '[class*="feature"]',
+    '.product-description',
+    '#product-description',
+    '[id*="about"]',
+    '[class*="about"]'
+])
+_PRICE_SELECTORS = compile_selectors([
+    '[class*="price"]',
+    '[id*="price"]',
+    '[data-testid*="price"]',
+    '.price-current',
+    '#priceblock_ourprice',
+    '#priceblock_dealprice',
+    '.a-price .a-offscreen',
+    'span.price',
+    '[class*="Price"]',
+    '[id*="mrp"]',
+    '[class*="mrp"]'
+])
+
+# Any of these means the page has rendered enough to parse
+_READY_SELECTOR = 'h1, [itemprop="price"], [class*="price"], meta[property="og:title"]'
+
+# Spec containers and the values pulled out of them
+_WS_RE = re.compile(r'\s+')
+
+_SPEC_CLASS_RE = re.compile(r'spec|feature|detail', re.I)
+_SPEC_PATTERNS = {
+    'battery': r'\d+\s*mAh',
+    'power': r'\d+\.?\d*\s*[Ww]att?s?',
+    'voltage': r'\d+\.?\d*\s*[Vv]olt?s?',
+    'weight': r'\d+\.?\d*\s*(?:kg|g|grams?)',
+}
+# All spec patterns in one zero-width alternation: one scan per container
+# yields the leftmost match of every pattern.
+_SPEC_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _SPEC_PATTERNS.items()) + ')',
+    re.I
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_price(price_str: str) -> Optional[float]:
+    """
+    Convert a matched amount to float, rejecting out-of-range values
+    Memoized: batch scrapes keep seeing the same amounts ("1,999", "499")
+    """
+    price_str = price_str.replace(',', '').replace('\xa0', '')
+    try:
+        price = float(price_str)
+    except ValueError:
+        return None
+    return price if 1 <= price <= 10000000 else None
+
+
+async def _block_heavy_requests(route) -> None:
+    """Route handler that drops resources not needed to read the page"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _TRACKER_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Keeps one Chromium instance alive and hands out a fresh context per scrape
+    Avoids paying browser startup on every request
+    """
+    
+    def __init__(
+        self,
+        max_contexts: int = POOL_MAX_CONTEXTS,
+        idle_timeout: float = POOL_IDLE_TIMEOUT
+    ):
+        self.max_contexts = max_contexts
+        self.idle_timeout = idle_timeout
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_contexts)
+        self._in_use = 0
+        self._last_used = time.monotonic()
+    
+    async def startup(self) -> None:
+        """Launch the shared browser (no-op if it is already healthy)"""
+        async with self._lock:
+            if self._is_healthy():
+                return
+            
+            await self._close_browser()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=True,
+                args=LAUNCH_ARGS
+            )
+            self._last_used = time.monotonic()
+    
+    async def shutdown(self) -> None:
+        """Close the shared browser and HTTP client"""
+        async with self._lock:
+            await self._close_browser()
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
+    
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for static fetches, created on first use"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                headers={'User-Agent': USER_AGENT, **EXTRA_HEADERS},
+                follow_redirects=True,
+                timeout=STATIC_FETCH_TIMEOUT
+            )
+        return self._http
+    
+    async def acquire(self) -> BrowserContext:
+        """Get a fresh browser context, relaunching the browser if needed"""
+        await self._slots.acquire()
+        try:
+            await self._recycle_if_idle()
+            await self.startup()
+            context = await self._browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=USER_AGENT
+            )
+            # Add extra headers to avoid detection
+            await context.set_extra_http_headers(EXTRA_HEADERS)
+            # Abort images, fonts, media and trackers so networkidle settles sooner
+            await context.route('**/*', _block_heavy_requests)
+        except Exception:
+            self._slots.release()
+            raise
+        
+        self._in_use += 1
+        return context
+    
+    async def release(self, context: BrowserContext) -> None:
+        """Close a context obtained from acquire()"""
+        try:
+            await context.close()
+        finally:
+            self._in_use -= 1
+            self._last_used = time.monotonic()
+            self._slots.release()
+    
+    def _is_healthy(self) -> bool:
+        """Check the browser process is still connected"""
+        return self._browser is not None and self._browser.is_connected()
+    
+    async def _recycle_if_idle(self) -> None:
+        """Restart a browser that sat idle too long to release leaked memory"""
+        if self._in_use or self._browser is None or self.idle_timeout <= 0:
+            return
+        if time.monotonic() - self._last_used > self.idle_timeout:
+            async with self._lock:
+                await self._close_browser()
+    
+    async def _close_browser(self) -> None:
+        """Close browser and Playwright driver, ignoring already-dead handles"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+        self._browser = None
+        self._playwright = None
+
+
+# Shared pool, started once with the API (see routes.py). Playwright handles
+# are bound to the loop that created them, so the pool only ever runs on the
+# background scraper loop below - use on_scraper_loop() to reach it.
+browser_pool = BrowserPool()
+
+T = TypeVar('T')
+
+_scraper_loop: Optional[asyncio.AbstractEventLoop] = None
+_scraper_loop_lock = threading.Lock()
+
+
+def _get_scraper_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the long-lived loop that owns browser_pool"""
+    global _scraper_loop
+    with _scraper_loop_lock:
+        if _scraper_loop is None:
+            _scraper_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_scraper_loop.run_forever,
+                name='browser-scraper',
+                daemon=True
+            ).start()
+    return _scraper_loop
+
+
+async def on_scraper_loop(coro: Awaitable[T]) -> T:
+    """Await a coroutine that uses browser_pool from any other event loop"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_scraper_loop())
+    return await asyncio.wrap_future(future)
 
 
 class BrowserScraper:
     """Browser automation for scraping product data"""
     
-    def __init__(self):
+    def __init__(self, pool: Optional[BrowserPool] = None):
         self.timeout = 15000  # 15 seconds
+        self.pool = pool or browser_pool
         
     async def extract_from_url(self, url: str) -> ProductData:
         """
         Extract product data using real browser
         Works with JavaScript sites and bypasses basic bot detection
+        Server-rendered pages are served by a plain HTTP fetch without the browser
         """
+        product = await self._try_static_fetch(url)
+        if product is not None:
+            return product
+        
         try:
-            async with async_playwright() as p:
-                # Launch browser in headless mode
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=['--disable-blink-features=AutomationControlled']
-                )
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                
-                # Add extra headers to avoid detection
-                await context.set_extra_http_headers({
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                })
-                
+            context = await self.pool.acquire()
+            try:
                 page = await context.new_page()
                 
                 # Navigate to URL with longer timeout
@@ -48,43 +325,30 @@ class BrowserScraper:
                     # Fallback to domcontentloaded if networkidle fails
                     await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
                 
-                # Wait for content to load
-                await page.wait_for_timeout(2000)  # Give time for JS to render
+                # Wait until a usable anchor is rendered instead of a fixed sleep
+                try:
+                    await page.wait_for_selector(
+                        _READY_SELECTOR, state='attached', timeout=3000
+                    )
+                except PlaywrightTimeout:
+                    pass
                 
                 # Get page content
                 content = await page.content()
-                
-                await browser.close()
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract data
-                title = self._extract_title(soup)
-                description = self._extract_description(soup)
-                price = self._extract_price(soup)
-                specs = self._extract_specs(soup)
-                currency = self._detect_currency(soup.get_text(), price)
-                raw_text = self._get_clean_text(soup)
-                
-                full_text = f"{title}. {description}. {raw_text}"
-                
-                # Validate we got meaningful data
-                if title == "Unknown Product" and not price:
-                    raise ValueError(
-                        "Could not extract product information from this page. "
-                        "The page structure may not be supported or it requires login."
-                    )
-                
-                return ProductData(
-                    title=title,
-                    description=description or "No description available",
-                    price=price,
-                    currency=currency,
-                    specs=specs,
-                    raw_text=full_text[:5000]
+            finally:
+                await self.pool.release(context)
+            
+            product = self._parse_page(content)
+            
+            # Validate we got meaningful data
+            if product.title == "Unknown Product" and not product.price:
+                raise ValueError(
+                    "Could not extract product information from this page. "
+                    "The page structure may not be supported or it requires login."
                 )
-                
+            
+            return product
+            
         except PlaywrightTimeout:
             raise ValueError(
                 "⏱️ Page load timeout - The website took too long to respond. "
@@ -96,25 +360,108 @@ class BrowserScraper:
                 "Please switch to text input and paste product details."
             )
     
+    async def _try_static_fetch(self, url: str) -> Optional[ProductData]:
+        """Fetch the page without a browser; None if it needs JavaScript to render"""
+        try:
+            response = await self.pool.http_client().get(url)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        
+        product = self._parse_page(response.text)
+        if product.title == "Unknown Product" or not product.price:
+            return None
+        return product
+    
+    def _parse_page(self, content: str) -> ProductData:
+        """Parse rendered HTML into product data"""
+        soup = make_soup(content)
+        
+        # Structured data beats walking the tree with selectors
+        product = self._parse_json_ld(soup)
+        if product is not None:
+            return product
+        
+        # Extract data
+        title = self._extract_title(soup)
+        description = self._extract_description(soup)
+        specs = self._extract_specs(soup)
+        
+        # Strip boilerplate once; price and currency read the whole clean text
+        raw_text = self._get_clean_text(soup)
+        price = self._extract_price(soup, raw_text)
+        currency = self._detect_currency(raw_text, price)
+        
+        # Only the first 3000 chars of page text, cut to what fits in 5000 chars
+        budget = min(3000, 5000 - len(title) - len(description) - 4)
+        full_text = f"{title}. {description}. {raw_text[:max(0, budget)]}"
+        
+        return ProductData(
+            title=title,
+            description=description or "No description available",
+            price=price,
+            currency=currency,
+            specs=specs,
+            raw_text=full_text[:5000]
+        )
+    
+    def _parse_json_ld(self, soup: BeautifulSoup) -> Optional[ProductData]:
+        """Build product data from a JSON-LD Product with a name and a price"""
+        node = find_json_ld_product(soup)
+        if node is None:
+            return None
+        
+        title = node.get('name')
+        offers = node.get('offers') or {}
+        if isinstance(offers, list):
+            offers = offers[0] if offers else {}
+        if not isinstance(title, str) or not title.strip() or not isinstance(offers, dict):
+            return None
+        
+        # AggregateOffer carries lowPrice instead of price
+        amount = offers.get('price', offers.get('lowPrice'))
+        price = _parse_price(str(amount)) if amount is not None else None
+        if price is None:
+            return None
+        
+        description = node.get('description')
+        if not isinstance(description, str) or not description.strip():
+            description = self._extract_description(soup)
+        title = title.strip()
+        description = description.strip()
+        
+        return ProductData(
+            title=title,
+            description=description or "No description available",
+            price=price,
+            currency=str(offers.get('priceCurrency') or 'USD').upper(),
+            specs=self._extract_specs(soup),
+            raw_text=f"{title}. {description}"[:5000]
+        )
+    
+    async def extract_many(
+        self, urls: List[str], concurrency: int = 3
+    ) -> List[Union[ProductData, Exception]]:
+        """
+        Extract several URLs concurrently, one context per URL in the shared browser
+        Failed URLs are returned as exceptions in their position
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _scrape_one(url: str) -> ProductData:
+            async with semaphore:
+                return await self.extract_from_url(url)
+        
+        return await asyncio.gather(
+            *(_scrape_one(url) for url in urls),
+            return_exceptions=True
+        )
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract product title"""
-        selectors = [
-            'h1[id*="title"]',
-            'h1[id*="productTitle"]',
-            'h1.product-title',
-            'h1[class*="product"]',
-            'h1[data-testid*="title"]',
-            '[data-testid="product-title"]',
-            'h1[class*="title"]',
-            '.product-name h1',
-            '#product-title',
-            'h1'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
+        for elements in select_grouped(soup, _TITLE_SELECTORS):
+            if elements:
+                text = elements[0].get_text(strip=True)
                 if len(text) > 10:
                     return text
         
@@ -127,26 +474,17 @@ class BrowserScraper:
     
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract product description"""
-        selectors = [
-            '[id*="description"]',
-            '[class*="description"]',
-            '[data-testid*="description"]',
-            'div.product-details',
-            '[id*="feature"]',
-            '[class*="feature"]',
-            '.product-description',
-            '#product-description',
-            '[id*="about"]',
-            '[class*="about"]'
-        ]
-        
         descriptions = []
-        for selector in selectors:
-            elements = soup.select(selector)
+        length = -1  # Joined length; the first join adds no separator
+        for elements in select_grouped(soup, _DESCRIPTION_SELECTORS):
             for element in elements[:3]:
                 text = element.get_text(strip=True)
                 if 20 < len(text) < 2000:
                     descriptions.append(text)
+                    length += len(text) + 1
+            # Later matches would only land past the 1500-char cut
+            if length >= 1500:
+                break
         
         if descriptions:
             return ' '.join(descriptions)[:1500]
@@ -158,24 +496,9 @@ class BrowserScraper:
         
         return ""
     
-    def _extract_price(self, soup: BeautifulSoup) -> Optional[float]:
-        """Extract price"""
-        selectors = [
-            '[class*="price"]',
-            '[id*="price"]',
-            '[data-testid*="price"]',
-            '.price-current',
-            '#priceblock_ourprice',
-            '#priceblock_dealprice',
-            '.a-price .a-offscreen',
-            'span.price',
-            '[class*="Price"]',
-            '[id*="mrp"]',
-            '[class*="mrp"]'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
+    def _extract_price(self, soup: BeautifulSoup, page_text: str) -> Optional[float]:
+        """Extract price from price elements, falling back to the page text"""
+        for elements in select_grouped(soup, _PRICE_SELECTORS):
             for element in elements:
                 price_text = element.get_text(strip=True)
                 price = self._extract_price_from_text(price_text)
@@ -183,31 +506,29 @@ class BrowserScraper:
                     return price
         
         # Try page text
-        return self._extract_price_from_text(soup.get_text())
+        return self._extract_price_from_text(page_text)
     
     def _extract_price_from_text(self, text: str) -> Optional[float]:
         """Extract numeric price"""
-        patterns = [
-            r'₹\s*([0-9,]+\.?[0-9]*)',
-            r'Rs\.?\s*([0-9,]+\.?[0-9]*)',
-            r'INR\s*([0-9,]+\.?[0-9]*)',
-            r'MRP[:\s]*₹?\s*([0-9,]+\.?[0-9]*)',
-            r'Price[:\s]*₹?\s*([0-9,]+\.?[0-9]*)',
-            r'\$\s*([0-9,]+\.?[0-9]*)',
-            r'(?:Price|price|Cost:|MRP|mrp)[:\s]*[₹\$€£¥Rs.]?\s*([0-9,]+\.?[0-9]*)',
-            r'\b([0-9]{2,6})\b'
-        ]
+        # First match of each pattern, keyed by preference
+        candidates = {}
+        for match in _PRICE_RE.finditer(text):
+            name = match.lastgroup
+            if name in candidates:
+                continue
+            candidates[name] = match.group(name)
+            if name in ('p3', 'p4'):
+                # 'MRP'/'Price' matches also satisfy the generic label pattern
+                candidates.setdefault('p6', candidates[name])
+            elif name == 'p0':
+                price = _parse_price(candidates[name])
+                if price is not None:
+                    return price  # Nothing outranks the first rupee price
         
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                price_str = match.group(1).replace(',', '').replace('\xa0', '')
-                try:
-                    price = float(price_str)
-                    if 1 <= price <= 10000000:
-                        return price
-                except ValueError:
-                    continue
+        for name in sorted(candidates):
+            price = _parse_price(candidates[name])
+            if price is not None:
+                return price
         return None
     
     def _extract_specs(self, soup: BeautifulSoup) -> Dict[str, Any]:
@@ -215,23 +536,23 @@ class BrowserScraper:
         specs = {}
         
         # Look for spec tables/lists
-        spec_containers = soup.find_all(['table', 'ul', 'div'], class_=re.compile(r'spec|feature|detail', re.I))
+        spec_containers = soup.find_all(['table', 'ul', 'div'], class_=_SPEC_CLASS_RE)
         
         for container in spec_containers[:5]:
-            text = container.get_text()
-            # Extract from text patterns
-            patterns = {
-                'battery': r'(\d+)\s*mAh',
-                'power': r'(\d+\.?\d*)\s*[Ww]att?s?',
-                'voltage': r'(\d+\.?\d*)\s*[Vv]olt?s?',
-                'weight': r'(\d+\.?\d*)\s*(?:kg|g|grams?)',
-            }
+            # Extract from text patterns, first match of each spec
+            found = {}
+            for match in _SPEC_RE.finditer(container.get_text()):
+                found.setdefault(match.lastgroup, match.group(match.lastgroup))
+                if len(found) == len(_SPEC_PATTERNS):
+                    break
+            
+            # Keep the pattern order for the specs dict
+            for spec_name in _SPEC_PATTERNS:
+                if spec_name not in specs and spec_name in found:
+                    specs[spec_name] = found[spec_name]
             
-            for spec_name, pattern in patterns.items():
-                if spec_name not in specs:
-                    match = re.search(pattern, text, re.I)
-                    if match:
-                        specs[spec_name] = match.group(0)
+            if len(specs) == len(_SPEC_PATTERNS):
+                break
         
         return specs
     
@@ -240,16 +561,16 @@ class BrowserScraper:
         if not price:
             return "USD"
         
-        text_lower = text.lower()
+        # Single pass over the text; rupee markers win outright
+        found = set()
+        for match in _CURRENCY_RE.finditer(text):
+            found.add(match.lastgroup)
+            if match.lastgroup == 'INR':
+                return "INR"
         
-        if '₹' in text or 'inr' in text_lower or 'rupee' in text_lower or 'rs.' in text or 'rs ' in text:
-            return "INR"
-        elif '€' in text or 'eur' in text_lower:
-            return "EUR"
-        elif '£' in text or 'gbp' in text_lower:
-            return "GBP"
-        elif '$' in text or 'usd' in text_lower:
-            return "USD"
+        for currency in _CURRENCY_PRIORITY:
+            if currency in found:
+                return currency
         
         # Heuristic: Indian prices are typically higher
         if price > 500:
@@ -261,15 +582,20 @@ class BrowserScraper:
         for script in soup(["script", "style", "nav", "footer", "header"]):
             script.decompose()
         
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text[:3000]
+        # Collapse every whitespace run in one C-level pass
+        return _WS_RE.sub(' ', soup.get_text()).strip()
 
 
 def extract_from_url_sync(url: str) -> ProductData:
-    """Synchronous wrapper for async scraper"""
-    scraper = BrowserScraper()
-    return asyncio.run(scraper.extract_from_url(url))
+    """
+    Synchronous wrapper for async scraper
+    Runs on the persistent scraper loop, so the browser is reused across calls
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        BrowserScraper().extract_from_url(url), _get_scraper_loop()
+    )
+    try:
+        return future.result(timeout=SYNC_SCRAPE_TIMEOUT)
+    except FutureTimeout:
+        future.cancel()
+        raise
@@ -2,9 +2,124 @@
 Feasibility verification engine
 Uses physics and engineering rules to validate product claims
 """
-from typing import List, Dict, Optional, Tuple
+import math
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from typing import Any, List, Dict, Optional, Tuple
 from app.models.schemas import Claim, ClaimVerification
 
+# Shared flag tuples, so verifications don't build a new list per call
+_FLAGS_IMPOSSIBLE_HIGH_CAPACITY = ('impossible', 'unrealistic', 'high_capacity')
+_FLAGS_IMPOSSIBLE_HYPE = ('impossible', 'unrealistic', 'marketing_hype')
+_FLAGS_PHYSICS_VIOLATION = ('impossible', 'unrealistic', 'physics_violation')
+_FLAGS_IMPOSSIBLE_UNSAFE = ('impossible', 'unrealistic', 'safety_concern')
+_FLAGS_IMPOSSIBLE = ('impossible', 'unrealistic')
+_FLAGS_UNSAFE = ('unrealistic', 'unsafe')
+_FLAGS_HIGH_CAPACITY = ('unusually_high', 'high_capacity')
+_FLAGS_UNUSUALLY_HIGH = ('unusually_high',)
+_FLAGS_HYPE = ('marketing_hype',)
+_FLAGS_EXTREME_CONDITIONS = ('extreme_conditions',)
+
+# Canned answers for numeric claims whose value could not be extracted
+_NO_VALUE_REASONING = {
+    'battery_capacity': 'Battery capacity mentioned but value not clearly specified',
+    'power_output': 'Power output mentioned but value not clear',
+    'efficiency': 'Efficiency mentioned but percentage not specified',
+    'speed': 'Speed mentioned but value not clear',
+    'range': 'Range mentioned but value not specified',
+    'charge_cycles': 'Charge cycles mentioned but value not specified',
+    'warranty': 'Warranty mentioned but period not specified',
+    'temperature': 'Temperature mentioned but range not specified',
+    'voltage': 'Voltage mentioned but value not specified',
+    'current': 'Current mentioned but value not specified',
+    'charging_time': 'Charging time mentioned but specifics unclear',
+}
+
+# Unit hints, matched as plain substrings of the lowered claim (as before)
+_HOUR_RE = re.compile('hour|hr')
+_YEAR_RE = re.compile('year|yr')
+
+# Recognised certification marks as whole words ("iso" may run into its number)
+_CERT_RE = re.compile(r'\b(?:ce|fcc|rohs|ul|etl|csa|mfi|iso)(?![a-z])')
+
+
+def _flatten_limits(values: Dict[str, Any]) -> SimpleNamespace:
+    """Expose a constraint dict as attributes; (lo, hi) pairs become name_lo/name_hi"""
+    flat = {}
+    for name, value in values.items():
+        if isinstance(value, tuple) and len(value) == 2:
+            flat[f'{name}_lo'], flat[f'{name}_hi'] = value
+        else:
+            flat[name] = value
+    return SimpleNamespace(**flat)
+
+
+def _above(limit: float) -> float:
+    """Smallest float greater than limit, so `value > limit` reads `value >= _above(limit)`"""
+    return math.nextafter(limit, math.inf)
+
+
+def _trie_regex(words) -> str:
+    """
+    Build a regex matching any of the words, with shared prefixes factored out
+    At each position only the branch for the next character is tried and the
+    longest word starting there wins (a stdlib stand-in for Aho-Corasick)
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ending here: the longer continuation is optional (and tried first)
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+
+@dataclass(slots=True)
+class _Verification:
+    """Internal verification result, converted to the schema at the engine boundary"""
+    claim: str
+    status: str
+    confidence: float
+    reasoning: str
+    technical_details: Optional[str] = None
+    flags: Tuple[str, ...] = ()
+    
+    def to_schema(self, category: Optional[str]) -> ClaimVerification:
+        """Build the public model without re-validating trusted fields"""
+        return ClaimVerification.model_construct(
+            claim=self.claim,
+            category=category,
+            status=self.status,
+            confidence=self.confidence,
+            reasoning=self.reasoning,
+            technical_details=self.technical_details,
+            flags=list(self.flags)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Ladder:
+    """
+    Inclusive lower bounds of a numeric verifier, in ascending order
+    outcomes[i] is (status, confidence, reasoning template, details, flags) for
+    values reaching exactly i bounds; whole_value renders the value as an int
+    """
+    thresholds: Tuple[float, ...]
+    outcomes: Tuple[Tuple[str, float, str, Optional[str], Tuple[str, ...]], ...]
+    whole_value: bool = False
+
 
 class FeasibilityEngine:
     """
@@ -75,12 +190,18 @@ class FeasibilityEngine:
                 'suspicious': 120,  # 10+ years unlikely
             },
             'temperature': {
-                'operating_range': (-20, 60),  # °C typical for electronics
-                'extreme_low': -40,  # °C absolute minimum
-                'extreme_high': 85,  # °C absolute maximum
+                'operating_range': (-20, 60),  # \u00b0C typical for electronics
+                'extreme_low': -40,  # \u00b0C absolute minimum
+                'extreme_high': 85,  # \u00b0C absolute maximum
             }
         }
         
+        # Flattened copy of the table: one attribute load per limit in the verifiers
+        self._limits = SimpleNamespace(**{
+            category: _flatten_limits(values)
+            for category, values in self.constraints.items()
+        })
+        
         # Red flag keywords
         self.red_flag_keywords = [
             'quantum', 'miracle', 'magic', 'infinite', 'unlimited',
@@ -89,102 +210,303 @@ class FeasibilityEngine:
             'zero maintenance', 'maintenance-free', 'lasts forever',
             'impossible to break', 'indestructible', 'unbreakable'
         ]
+        
+        # Red flags and generic buzzwords as one prefix-trie regex, so a single
+        # scan finds every occurrence (list order decides which red flag is
+        # reported, not position in the text). Phrase -> (kind, rank).
+        self._buzzword_kinds = {
+            kw.lower(): ('red_flag', i) for i, kw in enumerate(self.red_flag_keywords)
+        }
+        for kind, phrases in (
+            ('ai', ('ai-powered', 'ai powered')),
+            ('medical', ('medical-grade', 'medical grade')),
+            ('military', ('military-grade', 'military grade'))
+        ):
+            for phrase in phrases:
+                self._buzzword_kinds.setdefault(phrase, (kind, 0))
+        self._buzzword_re = re.compile('(?=(' + _trie_regex(self._buzzword_kinds) + '))')
+        
+        # Messages that depend only on the constraints, rendered once up front
+        self._red_flag_reasoning = [
+            f"'{keyword}' is a red flag term. Likely marketing hype with no scientific basis."
+            for keyword in self.red_flag_keywords
+        ]
+        self._unsafe_charge_details = (
+            f"Safe fast charging typically takes at least {self._limits.charging_time.min_safe_time} minutes"
+        )
+        self._warranty_details = (
+            f"Typical warranties: {self._limits.warranty.typical_range_lo}-"
+            f"{self._limits.warranty.typical_range_hi} months"
+        )
+        self._voltage_details = (
+            f"USB-PD max: {self._limits.voltage.max_safe}V. Higher voltages require special handling."
+        )
+        
+        # Verification is pure in (category, value, text): repeated claims are
+        # answered from a bounded cache (typed, since 5 and 5.0 render differently)
+        self._verify_cached = lru_cache(maxsize=4096, typed=True)(self._verify_uncached)
+        self._verify_value = lru_cache(maxsize=1024, typed=True)(self._verify_by_value)
+        
+        # Category -> verifier, bound once so routing is a single dict lookup.
+        # Numeric ladders are bisect tables over the value; the rest also read the
+        # lowered claim text, which is computed once and passed in.
+        self._ladders = self._build_ladders()
+        self._value_verifiers = {
+            category: partial(self._verify_ladder, ladder)
+            for category, ladder in self._ladders.items()
+        }
+        self._value_verifiers['voltage'] = self._verify_voltage
+        self._text_verifiers = {
+            'charging_time': self._verify_charging_time,
+            'marketing_buzzword': self._verify_buzzword,
+            'comparative': self._verify_comparative,
+            'warranty': self._verify_warranty,
+            'certifications': self._verify_certifications,
+        }
     
     def verify_claims(self, claims: List[Claim]) -> List[ClaimVerification]:
         """
         Verify all claims and return verification results
         """
-        verifications = []
-        
-        for claim in claims:
-            verification = self._verify_single_claim(claim)
-            verifications.append(verification)
-        
-        return verifications
+        # Batch path: resolve the verifier once, then one C-level list build
+        verify = self._verify_fields
+        return [verify(c.category, c.extracted_value, c.text).to_schema(c.category) for c in claims]
     
     def _verify_single_claim(self, claim: Claim) -> ClaimVerification:
         """Verify a single claim based on its category"""
-        
-        # Route to appropriate verification method
-        if claim.category == 'battery_capacity':
-            return self._verify_battery_capacity(claim)
-        elif claim.category == 'charging_time':
-            return self._verify_charging_time(claim)
-        elif claim.category == 'power_output':
-            return self._verify_power_output(claim)
-        elif claim.category == 'efficiency':
-            return self._verify_efficiency(claim)
-        elif claim.category == 'speed':
-            return self._verify_speed(claim)
-        elif claim.category == 'range':
-            return self._verify_range(claim)
-        elif claim.category == 'marketing_buzzword':
-            return self._verify_buzzword(claim)
-        elif claim.category == 'comparative':
-            return self._verify_comparative(claim)
-        elif claim.category == 'charge_cycles':
-            return self._verify_charge_cycles(claim)
-        elif claim.category == 'warranty':
-            return self._verify_warranty(claim)
-        elif claim.category == 'temperature':
-            return self._verify_temperature(claim)
-        elif claim.category == 'certifications':
-            return self._verify_certifications(claim)
-        elif claim.category == 'voltage':
-            return self._verify_voltage(claim)
-        elif claim.category == 'current':
-            return self._verify_current(claim)
-        else:
-            return ClaimVerification(
-                claim=claim.text,
-                status='feasible',
-                confidence=0.5,
-                reasoning='Unable to verify - category not recognized',
-                technical_details=None
-            )
+        return self._verify_fields(claim.category, claim.extracted_value, claim.text).to_schema(claim.category)
     
-    def _verify_battery_capacity(self, claim: Claim) -> ClaimVerification:
-        """Verify battery capacity claims"""
-        value = claim.extracted_value
+    def _verify_fields(
+        self, category: str, value: Optional[float], text: str
+    ) -> _Verification:
+        """
+        Numeric claims without a value get their canned answer straight away;
+        everything else goes through the cached verifiers (which may then
+        assume a value is present)
+        """
         if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Battery capacity mentioned but value not clearly specified'
-            )
-        
-        constraints = self.constraints['battery_capacity']
+            reasoning = _NO_VALUE_REASONING.get(category)
+            if reasoning is not None:
+                return self._create_verification(text, 'feasible', 0.6, reasoning)
+        return self._verify_cached(category, value, text)
+    
+    def _verify_uncached(
+        self, category: str, value: Optional[float], text: str
+    ) -> _Verification:
+        """Route to appropriate verification method"""
+        if category in self._value_verifiers:
+            # Same value, same verdict: only the claim text differs
+            return replace(self._verify_value(category, value), claim=text[:200])
+        
+        claim = Claim.model_construct(
+            text=text, category=category, extracted_value=value, unit=None
+        )
+        verifier = self._text_verifiers.get(category, self._verify_unknown)
+        return verifier(claim, text.lower())
+    
+    def _verify_by_value(self, category: str, value: Optional[float]) -> _Verification:
+        """Run a value-only threshold ladder once per distinct value"""
+        claim = Claim.model_construct(
+            text='', category=category, extracted_value=value, unit=None
+        )
+        return self._value_verifiers[category](claim)
+    
+    def _verify_unknown(self, claim: Claim, text_lower: str) -> _Verification:
+        """Fallback for categories without a verifier"""
+        return _Verification(
+            claim=claim.text,
+            status='feasible',
+            confidence=0.5,
+            reasoning='Unable to verify - category not recognized',
+            technical_details=None
+        )
+    
+    def _build_ladders(self) -> Dict[str, _Ladder]:
+        """
+        Turn the numeric threshold chains into bisect tables
+        Strict bounds (value > limit) are moved to the next float up, so every
+        bound is inclusive and bisect_right lands on the same branch as before
+        """
+        battery = self._limits.battery_capacity
+        power = self._limits.power_output
+        efficiency = self._limits.efficiency
+        speed = self._limits.speed
+        distance = self._limits.range
+        cycles = self._limits.charge_cycles
+        temperature = self._limits.temperature
+        current = self._limits.current
+        
+        extreme_temperature = (
+            'impossible', 0.90,
+            "Operating at {value}\u00b0C is unrealistic for consumer electronics.",
+            f"Typical range: {temperature.operating_range_lo} to {temperature.operating_range_hi}\u00b0C",
+            _FLAGS_IMPOSSIBLE
+        )
+        harsh_temperature = (
+            'exaggerated', 0.75,
+            "{value}\u00b0C is extreme but possible with special design.",
+            "Most consumer electronics operate in narrower range",
+            _FLAGS_EXTREME_CONDITIONS
+        )
         
-        if value > constraints['max_reasonable']:
-            return self._create_verification(
-                claim.text, 'impossible', 0.95,
-                f"Claimed {value}mAh is unrealistic for portable devices. "
-                f"Even large power banks rarely exceed {constraints['max_reasonable']}mAh.",
-                f"Would require extremely large/heavy battery. "
-                f"Typical range: {constraints['typical_range'][0]}-{constraints['typical_range'][1]}mAh",
-                flags=['impossible', 'unrealistic', 'high_capacity']
-            )
-        elif value > constraints['typical_range'][1]:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.85,
-                f"{value}mAh is unusually high. Possible but would be very large and heavy.",
-                f"Most portable power banks are {constraints['typical_range'][0]}-{constraints['typical_range'][1]}mAh",
-                flags=['unusually_high', 'high_capacity']
-            )
-        elif value >= constraints['typical_range'][0]:
-            return self._create_verification(
-                claim.text, 'feasible', 0.9,
-                f"{value}mAh is within normal range for portable power banks."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.85,
-                f"{value}mAh is low capacity but technically valid."
-            )
+        return {
+            'battery_capacity': _Ladder(
+                (battery.typical_range_lo, _above(battery.typical_range_hi),
+                 _above(battery.max_reasonable)),
+                (
+                    ('feasible', 0.85,
+                     "{value}mAh is low capacity but technically valid.", None, ()),
+                    ('feasible', 0.9,
+                     "{value}mAh is within normal range for portable power banks.", None, ()),
+                    ('exaggerated', 0.85,
+                     "{value}mAh is unusually high. Possible but would be very large and heavy.",
+                     f"Most portable power banks are {battery.typical_range_lo}-{battery.typical_range_hi}mAh",
+                     _FLAGS_HIGH_CAPACITY),
+                    ('impossible', 0.95,
+                     "Claimed {value}mAh is unrealistic for portable devices. "
+                     f"Even large power banks rarely exceed {battery.max_reasonable}mAh.",
+                     f"Would require extremely large/heavy battery. "
+                     f"Typical range: {battery.typical_range_lo}-{battery.typical_range_hi}mAh",
+                     _FLAGS_IMPOSSIBLE_HIGH_CAPACITY),
+                )
+            ),
+            # Anything over portable_max is already impossible, so the USB-PD
+            # ceiling (higher) never gets a bucket of its own
+            'power_output': _Ladder(
+                (_above(power.usb_fast), _above(power.portable_max)),
+                (
+                    ('feasible', 0.95,
+                     "{value}W is standard power output for modern USB devices.", None, ()),
+                    ('feasible', 0.90,
+                     "{value}W is high power output but achievable with USB-PD technology.", None, ()),
+                    ('impossible', 0.90,
+                     "{value}W output is unrealistic for portable devices. "
+                     f"USB-PD max is {power.usb_pd_max}W. Higher power requires wall outlet.",
+                     "Portable devices are typically limited to 100W due to battery and safety constraints",
+                     _FLAGS_IMPOSSIBLE),
+                )
+            ),
+            'efficiency': _Ladder(
+                (efficiency.typical_range_lo, _above(efficiency.typical_range_hi),
+                 _above(efficiency.theoretical_max), efficiency.carnot_limit),
+                (
+                    ('feasible', 0.85,
+                     "{value}% efficiency is low but technically possible for older or inefficient designs.",
+                     None, ()),
+                    ('feasible', 0.90,
+                     "{value}% efficiency is reasonable for modern electronic devices.", None, ()),
+                    ('exaggerated', 0.85,
+                     "{value}% efficiency is very high and unlikely for consumer products. "
+                     "Possible only in ideal laboratory conditions.",
+                     None, _FLAGS_UNUSUALLY_HIGH),
+                    ('impossible', 0.95,
+                     "{value}% efficiency is not achievable with current technology. "
+                     f"Even best-in-class devices rarely exceed {efficiency.theoretical_max}%.",
+                     "Best laboratory conditions achieve ~95-98% for power converters",
+                     _FLAGS_IMPOSSIBLE),
+                    ('impossible', 1.0,
+                     "100% or higher efficiency violates the laws of thermodynamics. "
+                     "All real devices lose some energy as heat.",
+                     "Second law of thermodynamics: no process can be 100% efficient",
+                     _FLAGS_PHYSICS_VIOLATION),
+                )
+            ),
+            'speed': _Ladder(
+                (_above(speed.escooter_reasonable), _above(speed.small_vehicle_max)),
+                (
+                    ('feasible', 0.90,
+                     "{value} km/h is reasonable speed for personal electric vehicles.", None, ()),
+                    ('feasible', 0.75,
+                     "{value} km/h is fast but achievable. Check local regulations - may be restricted.",
+                     None, ()),
+                    ('exaggerated', 0.80,
+                     "{value} km/h is very high for small electric vehicles. "
+                     "May be dangerous and likely illegal for street use.",
+                     f"Typical e-bikes/scooters: {speed.ebike_legal}-{speed.escooter_reasonable} km/h",
+                     ()),
+                )
+            ),
+            'range': _Ladder(
+                (distance.ev_realistic_lo, _above(distance.ev_realistic_hi)),
+                (
+                    ('feasible', 0.90,
+                     "{value} km is conservative range estimate.", None, ()),
+                    ('feasible', 0.85,
+                     "{value} km range is achievable for modern electric vehicles.", None, ()),
+                    ('exaggerated', 0.80,
+                     "{value} km range is very high for small electric vehicles. "
+                     "Would require very large battery. Verify test conditions.",
+                     f"Typical small EV range: {distance.ev_realistic_lo}-{distance.ev_realistic_hi} km",
+                     ()),
+                )
+            ),
+            'charge_cycles': _Ladder(
+                (cycles.typical_range_lo, cycles.good_range_lo,
+                 _above(cycles.exceptional), _above(cycles.impossible)),
+                (
+                    ('feasible', 0.75,
+                     "{value} cycles is low quality but technically possible.", None, ()),
+                    ('feasible', 0.85,
+                     "{value} cycles is typical battery lifespan.", None, ()),
+                    ('feasible', 0.90,
+                     "{value} cycles is good quality battery lifespan.", None, ()),
+                    ('exaggerated', 0.80,
+                     "{value} cycles is exceptionally high. Possible for premium batteries but uncommon.",
+                     f"Good quality range: {cycles.good_range_lo}-{cycles.good_range_hi} cycles",
+                     _FLAGS_UNUSUALLY_HIGH),
+                    ('impossible', 0.95,
+                     "{value} cycles is unrealistic. Even premium batteries rarely exceed 2000-3000 cycles.",
+                     f"Typical Li-ion: {cycles.typical_range_lo}-{cycles.typical_range_hi} cycles",
+                     _FLAGS_IMPOSSIBLE),
+                ),
+                whole_value=True
+            ),
+            # Two-sided: the outer buckets mirror each other
+            'temperature': _Ladder(
+                (temperature.extreme_low, temperature.operating_range_lo,
+                 _above(temperature.operating_range_hi), _above(temperature.extreme_high)),
+                (
+                    extreme_temperature,
+                    harsh_temperature,
+                    ('feasible', 0.90,
+                     "{value}\u00b0C is within normal operating range for electronics.", None, ()),
+                    harsh_temperature,
+                    extreme_temperature,
+                )
+            ),
+            'current': _Ladder(
+                (current.usb_standard, current.usb_fast, _above(current.max_safe)),
+                (
+                    ('feasible', 0.85,
+                     "{value}A is low current, slower charging.", None, ()),
+                    ('feasible', 0.95,
+                     "{value}A is standard to moderate charging current.", None, ()),
+                    ('feasible', 0.90,
+                     "{value}A is fast charging current. Requires proper cables and port.", None, ()),
+                    ('impossible', 0.85,
+                     "{value}A exceeds safe limits for portable USB devices.",
+                     f"Typical USB fast charge: {current.usb_fast}A max. Higher requires specialized cables.",
+                     _FLAGS_IMPOSSIBLE_UNSAFE),
+                )
+            ),
+        }
+    
+    def _verify_ladder(self, ladder: _Ladder, claim: Claim) -> _Verification:
+        """Verify a numeric claim by bisecting its category's thresholds"""
+        value = claim.extracted_value
+        status, confidence, reasoning, technical_details, flags = (
+            ladder.outcomes[bisect_right(ladder.thresholds, value)]
+        )
+        return self._create_verification(
+            claim.text, status, confidence,
+            reasoning.format(value=int(value) if ladder.whole_value else value),
+            technical_details,
+            flags=flags
+        )
     
-    def _verify_charging_time(self, claim: Claim) -> ClaimVerification:
+    def _verify_charging_time(self, claim: Claim, text_lower: str) -> _Verification:
         """Verify charging time claims"""
         # Extract time in minutes
-        text_lower = claim.text.lower()
         time_minutes = self._extract_time_in_minutes(text_lower, claim.extracted_value)
         
         if time_minutes is None:
@@ -193,7 +515,7 @@ class FeasibilityEngine:
                 'Charging time mentioned but specifics unclear'
             )
         
-        constraints = self.constraints['charging_time']
+        limits = self._limits.charging_time
         
         if time_minutes < 5:
             return self._create_verification(
@@ -201,15 +523,15 @@ class FeasibilityEngine:
                 f"Charging in {time_minutes} minutes is physically impossible for typical batteries. "
                 "Even with highest charging rates, battery chemistry requires minimum time.",
                 "Current technology limits: minimum ~15-30 minutes for fast charge of small batteries",
-                flags=['impossible', 'unrealistic']
+                flags=_FLAGS_IMPOSSIBLE
             )
-        elif time_minutes < constraints['min_safe_time']:
+        elif time_minutes < limits.min_safe_time:
             return self._create_verification(
                 claim.text, 'exaggerated', 0.90,
                 f"Charging in {time_minutes} minutes is extremely aggressive and likely unsafe. "
                 "High risk of battery damage, overheating, or reduced lifespan.",
-                f"Safe fast charging typically takes at least {constraints['min_safe_time']} minutes",
-                flags=['unrealistic', 'unsafe']
+                self._unsafe_charge_details,
+                flags=_FLAGS_UNSAFE
             )
         elif time_minutes < 30:
             return self._create_verification(
@@ -223,178 +545,46 @@ class FeasibilityEngine:
                 f"Charging time of {time_minutes} minutes is reasonable and safe."
             )
     
-    def _verify_power_output(self, claim: Claim) -> ClaimVerification:
-        """Verify power output claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Power output mentioned but value not clear'
-            )
-        
-        constraints = self.constraints['power_output']
+    def _verify_buzzword(self, claim: Claim, text_lower: str) -> _Verification:
+        """Verify marketing buzzwords"""
+        # One pass collects red flags and generic buzzwords
+        red_flag_rank = None
+        found = set()
+        for match in self._buzzword_re.finditer(text_lower):
+            kind, rank = self._buzzword_kinds[match.group(1)]
+            if kind == 'red_flag':
+                if red_flag_rank is None or rank < red_flag_rank:
+                    red_flag_rank = rank
+            else:
+                found.add(kind)
         
-        if value > constraints['portable_max']:
+        # Check for red flag keywords
+        if red_flag_rank is not None:
             return self._create_verification(
                 claim.text, 'impossible', 0.90,
-                f"{value}W output is unrealistic for portable devices. "
-                f"USB-PD max is {constraints['usb_pd_max']}W. Higher power requires wall outlet.",
-                "Portable devices are typically limited to 100W due to battery and safety constraints",
-                flags=['impossible', 'unrealistic']
-            )
-        elif value > constraints['usb_pd_max']:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.85,
-                f"{value}W exceeds USB Power Delivery standard ({constraints['usb_pd_max']}W max). "
-                "Likely marketing exaggeration or requires special conditions.",
-                flags=['unusually_high']
-            )
-        elif value > constraints['usb_fast']:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value}W is high power output but achievable with USB-PD technology."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.95,
-                f"{value}W is standard power output for modern USB devices."
-            )
-    
-    def _verify_efficiency(self, claim: Claim) -> ClaimVerification:
-        """Verify efficiency claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Efficiency mentioned but percentage not specified'
-            )
-        
-        constraints = self.constraints['efficiency']
-        
-        if value >= 100:
-            return self._create_verification(
-                claim.text, 'impossible', 1.0,
-                "100% or higher efficiency violates the laws of thermodynamics. "
-                "All real devices lose some energy as heat.",
-                "Second law of thermodynamics: no process can be 100% efficient",
-                flags=['impossible', 'unrealistic', 'physics_violation']
-            )
-        elif value > constraints['theoretical_max']:
-            return self._create_verification(
-                claim.text, 'impossible', 0.95,
-                f"{value}% efficiency is not achievable with current technology. "
-                f"Even best-in-class devices rarely exceed {constraints['theoretical_max']}%.",
-                "Best laboratory conditions achieve ~95-98% for power converters",
-                flags=['impossible', 'unrealistic']
-            )
-        elif value > constraints['typical_range'][1]:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.85,
-                f"{value}% efficiency is very high and unlikely for consumer products. "
-                "Possible only in ideal laboratory conditions.",
-                flags=['unusually_high']
-            )
-        elif value >= constraints['typical_range'][0]:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value}% efficiency is reasonable for modern electronic devices."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.85,
-                f"{value}% efficiency is low but technically possible for older or inefficient designs."
-            )
-    
-    def _verify_speed(self, claim: Claim) -> ClaimVerification:
-        """Verify speed claims for vehicles/devices"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Speed mentioned but value not clear'
-            )
-        
-        constraints = self.constraints['speed']
-        
-        if value > constraints['small_vehicle_max']:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.80,
-                f"{value} km/h is very high for small electric vehicles. "
-                "May be dangerous and likely illegal for street use.",
-                f"Typical e-bikes/scooters: {constraints['ebike_legal']}-{constraints['escooter_reasonable']} km/h"
-            )
-        elif value > constraints['escooter_reasonable']:
-            return self._create_verification(
-                claim.text, 'feasible', 0.75,
-                f"{value} km/h is fast but achievable. Check local regulations - may be restricted."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value} km/h is reasonable speed for personal electric vehicles."
-            )
-    
-    def _verify_range(self, claim: Claim) -> ClaimVerification:
-        """Verify range/distance claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Range mentioned but value not specified'
-            )
-        
-        constraints = self.constraints['range']
-        
-        if value > constraints['ev_realistic'][1]:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.80,
-                f"{value} km range is very high for small electric vehicles. "
-                "Would require very large battery. Verify test conditions.",
-                f"Typical small EV range: {constraints['ev_realistic'][0]}-{constraints['ev_realistic'][1]} km"
-            )
-        elif value >= constraints['ev_realistic'][0]:
-            return self._create_verification(
-                claim.text, 'feasible', 0.85,
-                f"{value} km range is achievable for modern electric vehicles."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value} km is conservative range estimate."
+                self._red_flag_reasoning[red_flag_rank],
+                "Be skeptical of extraordinary claims without evidence",
+                flags=_FLAGS_IMPOSSIBLE_HYPE
             )
-    
-    def _verify_buzzword(self, claim: Claim) -> ClaimVerification:
-        """Verify marketing buzzwords"""
-        text_lower = claim.text.lower()
-        
-        # Check for red flag keywords
-        for red_flag in self.red_flag_keywords:
-            if red_flag.lower() in text_lower:
-                return self._create_verification(
-                    claim.text, 'impossible', 0.90,
-                    f"'{red_flag}' is a red flag term. Likely marketing hype with no scientific basis.",
-                    "Be skeptical of extraordinary claims without evidence",
-                    flags=['impossible', 'unrealistic', 'marketing_hype']
-                )
         
         # Generic buzzwords
-        if any(word in text_lower for word in ['ai-powered', 'ai powered']):
+        if 'ai' in found:
             return self._create_verification(
                 claim.text, 'exaggerated', 0.75,
                 "'AI-powered' is often marketing hype. True AI requires significant computational resources. "
                 "May just be simple algorithms or microcontroller logic.",
                 "Ask: What specific AI technology? What's the training data? What's the model?",
-                flags=['marketing_hype']
+                flags=_FLAGS_HYPE
             )
         
-        if any(word in text_lower for word in ['medical-grade', 'medical grade']):
+        if 'medical' in found:
             return self._create_verification(
                 claim.text, 'exaggerated', 0.80,
                 "'Medical-grade' is loosely regulated term. Unless FDA/CE certified, it's likely marketing.",
                 "True medical devices require regulatory approval and clinical testing"
             )
         
-        if any(word in text_lower for word in ['military-grade', 'military grade']):
+        if 'military' in found:
             return self._create_verification(
                 claim.text, 'exaggerated', 0.75,
                 "'Military-grade' has no standard definition for consumer products. "
@@ -408,10 +598,9 @@ class FeasibilityEngine:
             "Look for specific, measurable specifications instead of vague marketing terms"
         )
     
-    def _verify_comparative(self, claim: Claim) -> ClaimVerification:
+    def _verify_comparative(self, claim: Claim, text_lower: str) -> _Verification:
         """Verify comparative claims (2x faster, etc.)"""
         value = claim.extracted_value
-        text_lower = claim.text.lower()
         
         if value and value > 10:
             return self._create_verification(
@@ -446,7 +635,7 @@ class FeasibilityEngine:
             return None
         
         # Check if hours or minutes
-        if 'hour' in text or 'hr' in text:
+        if _HOUR_RE.search(text):
             return value * 60
         else:
             return value
@@ -458,89 +647,42 @@ class FeasibilityEngine:
         confidence: float,
         reasoning: str,
         technical_details: Optional[str] = None,
-        flags: Optional[List[str]] = None
-    ) -> ClaimVerification:
+        flags: Tuple[str, ...] = ()
+    ) -> _Verification:
         """Helper to create verification object"""
-        return ClaimVerification(
+        return _Verification(
             claim=claim[:200],  # Truncate long claims
             status=status,
             confidence=confidence,
             reasoning=reasoning,
             technical_details=technical_details,
-            flags=flags or []
+            flags=flags
         )
     
-    def _verify_charge_cycles(self, claim: Claim) -> ClaimVerification:
-        """Verify charge cycle claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Charge cycles mentioned but value not specified'
-            )
-        
-        constraints = self.constraints['charge_cycles']
-        
-        if value > constraints['impossible']:
-            return self._create_verification(
-                claim.text, 'impossible', 0.95,
-                f"{int(value)} cycles is unrealistic. Even premium batteries rarely exceed 2000-3000 cycles.",
-                f"Typical Li-ion: {constraints['typical_range'][0]}-{constraints['typical_range'][1]} cycles",
-                flags=['impossible', 'unrealistic']
-            )
-        elif value > constraints['exceptional']:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.80,
-                f"{int(value)} cycles is exceptionally high. Possible for premium batteries but uncommon.",
-                f"Good quality range: {constraints['good_range'][0]}-{constraints['good_range'][1]} cycles",
-                flags=['unusually_high']
-            )
-        elif value >= constraints['good_range'][0]:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{int(value)} cycles is good quality battery lifespan."
-            )
-        elif value >= constraints['typical_range'][0]:
-            return self._create_verification(
-                claim.text, 'feasible', 0.85,
-                f"{int(value)} cycles is typical battery lifespan."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.75,
-                f"{int(value)} cycles is low quality but technically possible."
-            )
-    
-    def _verify_warranty(self, claim: Claim) -> ClaimVerification:
+    def _verify_warranty(self, claim: Claim, text_lower: str) -> _Verification:
         """Verify warranty claims"""
         value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Warranty mentioned but period not specified'
-            )
-        
-        constraints = self.constraints['warranty']
+        limits = self._limits.warranty
         
         # Convert years to months if needed
-        if 'year' in claim.text.lower() or 'yr' in claim.text.lower():
+        if _YEAR_RE.search(text_lower):
             value_months = value * 12
         else:
             value_months = value
         
-        if value_months > constraints['suspicious']:
+        if value_months > limits.suspicious:
             return self._create_verification(
                 claim.text, 'exaggerated', 0.80,
                 f"{int(value_months/12)} year warranty is unusually long. Verify fine print for conditions.",
-                f"Typical warranties: {constraints['typical_range'][0]}-{constraints['typical_range'][1]} months",
-                flags=['unusually_high']
+                self._warranty_details,
+                flags=_FLAGS_UNUSUALLY_HIGH
             )
-        elif value_months >= constraints['good_warranty']:
+        elif value_months >= limits.good_warranty:
             return self._create_verification(
                 claim.text, 'feasible', 0.90,
                 f"{int(value_months/12)} year warranty is good coverage."
             )
-        elif value_months >= constraints['typical_range'][0]:
+        elif value_months >= limits.typical_range_lo:
             return self._create_verification(
                 claim.text, 'feasible', 0.85,
                 f"{int(value_months)} month warranty is standard."
@@ -551,46 +693,10 @@ class FeasibilityEngine:
                 f"{int(value_months)} month warranty is minimal coverage."
             )
     
-    def _verify_temperature(self, claim: Claim) -> ClaimVerification:
-        """Verify operating temperature claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Temperature mentioned but range not specified'
-            )
-        
-        constraints = self.constraints['temperature']
-        
-        if value < constraints['extreme_low'] or value > constraints['extreme_high']:
-            return self._create_verification(
-                claim.text, 'impossible', 0.90,
-                f"Operating at {value}\u00b0C is unrealistic for consumer electronics.",
-                f"Typical range: {constraints['operating_range'][0]} to {constraints['operating_range'][1]}\u00b0C",
-                flags=['impossible', 'unrealistic']
-            )
-        elif value < constraints['operating_range'][0] or value > constraints['operating_range'][1]:
-            return self._create_verification(
-                claim.text, 'exaggerated', 0.75,
-                f"{value}\u00b0C is extreme but possible with special design.",
-                "Most consumer electronics operate in narrower range",
-                flags=['extreme_conditions']
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value}\u00b0C is within normal operating range for electronics."
-            )
-    
-    def _verify_certifications(self, claim: Claim) -> ClaimVerification:
+    def _verify_certifications(self, claim: Claim, text_lower: str) -> _Verification:
         """Verify certification claims"""
-        text_lower = claim.text.lower()
-        
         # Major legitimate certifications
-        legitimate_certs = ['ce', 'fcc', 'rohs', 'ul', 'etl', 'csa', 'mfi', 'iso']
-        has_legit = any(cert in text_lower for cert in legitimate_certs)
-        
-        if has_legit:
+        if _CERT_RE.search(text_lower):
             return self._create_verification(
                 claim.text, 'feasible', 0.85,
                 "Legitimate certifications mentioned. Verify on manufacturer website.",
@@ -603,30 +709,24 @@ class FeasibilityEngine:
                 "Look for specific certification numbers and issuing body"
             )
     
-    def _verify_voltage(self, claim: Claim) -> ClaimVerification:
+    def _verify_voltage(self, claim: Claim) -> _Verification:
         """Verify voltage claims"""
         value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Voltage mentioned but value not specified'
-            )
+        limits = self._limits.voltage
         
-        constraints = self.constraints['voltage']
-        
-        if value > constraints['max_safe']:
+        if value > limits.max_safe:
             return self._create_verification(
                 claim.text, 'impossible', 0.90,
                 f"{value}V exceeds safe limits for consumer portable devices.",
-                f"USB-PD max: {constraints['max_safe']}V. Higher voltages require special handling.",
-                flags=['impossible', 'unrealistic', 'safety_concern']
+                self._voltage_details,
+                flags=_FLAGS_IMPOSSIBLE_UNSAFE
             )
-        elif value in constraints['usb_pd']:
+        elif value in limits.usb_pd:
             return self._create_verification(
                 claim.text, 'feasible', 0.95,
                 f"{value}V is standard USB Power Delivery voltage."
             )
-        elif value == constraints['usb_standard']:
+        elif value == limits.usb_standard:
             return self._create_verification(
                 claim.text, 'feasible', 0.95,
                 f"{value}V is standard USB voltage."
@@ -636,38 +736,15 @@ class FeasibilityEngine:
                 claim.text, 'feasible', 0.75,
                 f"{value}V is non-standard but technically possible. Verify compatibility."
             )
-    
-    def _verify_current(self, claim: Claim) -> ClaimVerification:
-        """Verify current/amperage claims"""
-        value = claim.extracted_value
-        if value is None:
-            return self._create_verification(
-                claim.text, 'feasible', 0.6,
-                'Current mentioned but value not specified'
-            )
-        
-        constraints = self.constraints['current']
-        
-        if value > constraints['max_safe']:
-            return self._create_verification(
-                claim.text, 'impossible', 0.85,
-                f"{value}A exceeds safe limits for portable USB devices.",
-                f"Typical USB fast charge: {constraints['usb_fast']}A max. Higher requires specialized cables.",
-                flags=['impossible', 'unrealistic', 'safety_concern']
-            )
-        elif value >= constraints['usb_fast']:
-            return self._create_verification(
-                claim.text, 'feasible', 0.90,
-                f"{value}A is fast charging current. Requires proper cables and port."
-            )
-        elif value >= constraints['usb_standard']:
-            return self._create_verification(
-                claim.text, 'feasible', 0.95,
-                f"{value}A is standard to moderate charging current."
-            )
-        else:
-            return self._create_verification(
-                claim.text, 'feasible', 0.85,
-                f"{value}A is low current, slower charging."
-            )
 
+
+# Shared engine: its tables, regexes and caches are built once per process
+_default_engine: Optional[FeasibilityEngine] = None
+
+
+def get_engine() -> FeasibilityEngine:
+    """Return the process-wide FeasibilityEngine, creating it on first use"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = FeasibilityEngine()
+    return _default_engine
@@ -3,172 +3,221 @@ NLP-based claim extraction from product descriptions
 Uses pattern matching and keyword detection to identify product claims
 """
 import re
+from types import MappingProxyType
 from typing import List, Dict, Optional, Tuple
 from app.models.schemas import Claim, ProductData
 
+# Characters that re.IGNORECASE equates with an ASCII letter but str.lower()
+# does not (or, for dotted capital I, lowers to two characters)
+_CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+# Everything but digits and the decimal point, stripped from captured values
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+# Comparative claims (2x faster, 50% more, etc.)
+_COMPARATIVE_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'(\d+)x\s+(?:faster|stronger|better|more\s+powerful)',
+        r'(\d+)%\s+(?:faster|stronger|better|more)',
+        r'(?:faster|stronger|better)\s+than.*?(?:competition|others|leading)',
+        r'(?:best|fastest|strongest|most\s+powerful)\s+(?:in|on)\s+(?:market|earth|world)'
+    )
+]
+
+# Performance claim patterns with categories. 'requires' lists literals
+# of which every pattern in the category needs at least one
+_CLAIM_PATTERN_SOURCES = {
+    'battery_capacity': {
+        'patterns': [
+            r'(\d+)\s*mah',
+            r'(\d+)\s*milliamp hour',
+            r'battery.*?(\d+)\s*mah',
+            r'(\d+)\s*wh(?:our)?',
+            r'capacity[:\s]+(\d+)\s*mah',
+            r'(\d+,\d+)\s*mah',  # Format like 10,000mAh
+            r'battery\s+size[:\s]+(\d+)\s*mah'
+        ],
+        'unit': 'mAh',
+        'keywords': ['battery', 'capacity', 'power bank', 'cell'],
+        'requires': ['mah', 'milliamp hour', 'wh']
+    },
+    'charging_time': {
+        'patterns': [
+            r'charges?\s+(?:in|within)\s+(\d+)\s*(minutes?|mins?|hours?|hrs?)',
+            r'(\d+)\s*(minutes?|mins?|hours?|hrs?)\s+(?:fast\s+)?(?:charg(?:e|ing)|to\s+full)',
+            r'quick\s+charge.*?(\d+)\s*(minutes?|mins?|hours?|hrs?)',
+            r'full\s+charge.*?(\d+)\s*(hours?|hrs?)',
+            r'charging\s+time[:\s]+(\d+)\s*(hours?|hrs?|minutes?|mins?)',
+            r'(?:0|zero)\s*-?\s*(\d+)\s*%\s+(?:in|within)\s+(\d+)\s*(minutes?|mins?)',
+            r'recharge.*?(?:in|within)\s+(\d+)\s*(hours?|hrs?|minutes?|mins?)',
+            r'(\d+)\s*(min|hr)\s+(?:charge|charging)'
+        ],
+        'unit': 'time',
+        'subunit_last_group': True,  # every pattern ends with its time unit
+        'keywords': ['charge', 'charging time', 'fast charge', 'full charge', 'recharge'],
+        'requires': ['charg', 'full', '%']
+    },
+    'power_output': {
+        'patterns': [
+            r'(\d+\.?\d*)\s*w(?:att)?(?:\s+(?:output|power|charging|fast))?',
+            r'(\d+\.?\d*)\s*w\s+(?:fast|quick|rapid|super|hyper)',
+            r'power.*?(\d+\.?\d*)\s*w',
+            r'output[:\s]+(\d+\.?\d*)\s*w',
+            r'(\d+\.?\d*)\s*w\s+(?:type-?c|usb|pd|qc)'
+        ],
+        'unit': 'W',
+        'keywords': ['power', 'watt', 'output', 'fast charging', 'PD', 'QC']
+    },
+    'speed': {
+        'patterns': [
+            r'(\d+)\s*(?:mph|km/h|kmph|kilometers?\s+per\s+hour)',
+            r'top\s+speed.*?(\d+)',
+            r'speed.*?(\d+)\s*(?:mph|km/h)'
+        ],
+        'unit': 'speed',
+        'keywords': ['speed', 'mph', 'kmph', 'fast'],
+        'requires': ['mph', 'km/h', 'kmph', 'kilometer', 'speed']
+    },
+    'range': {
+        'patterns': [
+            r'(?:range|distance).*?(\d+)\s*(?:km|miles?|kilometers?)',
+            r'(\d+)\s*(?:km|miles?)\s+range',
+            r'up\s+to\s+(\d+)\s*(?:km|miles?)'
+        ],
+        'unit': 'distance',
+        'keywords': ['range', 'distance', 'coverage'],
+        'requires': ['range', 'distance', 'km', 'mile']
+    },
+    'efficiency': {
+        'patterns': [
+            r'(\d+)%\s+efficien(?:cy|t)',
+            r'efficien(?:cy|t).*?(\d+)%',
+            r'(\d+)\s*percent\s+efficient'
+        ],
+        'unit': '%',
+        'keywords': ['efficiency', 'efficient', 'energy saving'],
+        'requires': ['efficien']
+    },
+    'weight': {
+        'patterns': [
+            r'(\d+\.?\d*)\s*(?:kg|g|grams?|kilograms?|lbs?|pounds?)',
+            r'weighs?.*?(\d+\.?\d*)\s*(?:kg|g|lbs?)',
+            r'(?:ultra|super)?\s*light.*?(\d+\.?\d*)\s*(?:kg|g)'
+        ],
+        'unit': 'weight',
+        'keywords': ['weight', 'lightweight', 'portable']
+    },
+    'capacity_storage': {
+        'patterns': [
+            r'(\d+)\s*(?:gb|tb|mb)',
+            r'storage.*?(\d+)\s*(?:gb|tb)',
+            r'(\d+)\s*(?:liter|litre|l|ml)'
+        ],
+        'unit': 'capacity',
+        'keywords': ['storage', 'capacity', 'memory']
+    },
+    'voltage': {
+        'patterns': [
+            r'(\d+\.?\d*)\s*v(?:olt)?(?:\s+(?:input|output))?',
+            r'voltage[:\s]+(\d+\.?\d*)\s*v',
+            r'(\d+\.?\d*)\s*v\s+(?:dc|ac)'
+        ],
+        'unit': 'V',
+        'keywords': ['voltage', 'volt', 'power']
+    },
+    'current': {
+        'patterns': [
+            r'(\d+\.?\d*)\s*a(?:mp)?(?:\s+(?:input|output))?',
+            r'current[:\s]+(\d+\.?\d*)\s*a',
+            r'(\d+\.?\d*)\s*a\s+(?:fast|quick)'
+        ],
+        'unit': 'A',
+        'keywords': ['current', 'amp', 'ampere']
+    },
+    'charge_cycles': {
+        'patterns': [
+            r'(\d+)\+?\s*(?:charge\s+)?cycles?',
+            r'(?:up\s+to\s+)?(\d+)\s+(?:charge\s+)?cycles?',
+            r'cycle\s+life[:\s]+(\d+)',
+            r'lifespan[:\s]+(\d+)\s+cycles?'
+        ],
+        'unit': 'cycles',
+        'keywords': ['cycle', 'lifespan', 'durability'],
+        'requires': ['cycle']
+    },
+    'warranty': {
+        'patterns': [
+            r'(\d+)\s*(?:year|month|yr|mo)\s+warranty',
+            r'warranty[:\s]+(\d+)\s+(?:year|month)',
+            r'(\d+)\s*(?:year|yr)\s+(?:guarantee|coverage)'
+        ],
+        'unit': 'period',
+        'keywords': ['warranty', 'guarantee', 'coverage'],
+        'requires': ['warranty', 'guarantee', 'coverage']
+    },
+    'temperature': {
+        'patterns': [
+            r'(?:operating|working)\s+temp.*?([-\d]+)\s*[°]?[cf]',
+            r'([-\d]+)[°]?\s*c\s+to\s+([-\d]+)[°]?\s*c',
+            r'temperature.*?([-\d]+)\s*[°]?[cf]'
+        ],
+        'unit': 'temp',
+        'keywords': ['temperature', 'operating temp', 'thermal'],
+        'requires': ['temp', 'to']
+    },
+    'certifications': {
+        'patterns': [
+            r'\b(ce|fcc|rohs|ul|etl|csa)\s+certified',
+            r'\b(iso\s*\d+)',
+            r'certified\s+(?:by\s+)?(ce|fcc|rohs|ul)',
+            r'\b(mfi|made\s+for\s+iphone)'
+        ],
+        'unit': 'certification',
+        'keywords': ['certified', 'certification', 'approved', 'compliant'],
+        'requires': ['certified', 'iso', 'mfi', 'iphone']
+    }
+}
+
+# Compiled once at import. Patterns are lowercase and run against lowercased
+# text, so none needs IGNORECASE
+_CLAIM_PATTERNS = MappingProxyType({
+    category: {**config, 'patterns': [re.compile(pattern) for pattern in config['patterns']]}
+    for category, config in _CLAIM_PATTERN_SOURCES.items()
+})
+
+# Marketing buzzwords to flag
+_BUZZWORDS = (
+    'AI-powered', 'AI powered', 'artificial intelligence',
+    'medical-grade', 'medical grade', 'hospital grade',
+    'military-grade', 'military grade', 'military spec',
+    'NASA-approved', 'NASA grade', 'space grade',
+    'quantum', 'revolutionary', 'breakthrough', 'patent pending',
+    'miracle', 'magic', 'ultimate', 'absolute',
+    'guaranteed', '100% safe', 'zero risk', 'risk-free',
+    'clinically proven', 'scientifically proven', 'lab tested',
+    'professional grade', 'industrial strength',
+    'never seen before', 'world first', 'industry leading',
+    'unlimited', 'infinite', 'perpetual', 'lifetime',
+    'award winning', 'best in class', '#1 rated'
+)
+
+# All buzzwords in one scan: a named group per buzzword inside a lookahead,
+# so occurrences may overlap as they did with one scan each
+_BUZZWORD_RE = re.compile(
+    r'(?=\b(?:' + '|'.join(
+        f'(?P<b{i}>{re.escape(buzzword.lower())})'
+        for i, buzzword in enumerate(_BUZZWORDS)
+    ) + r')\b)'
+)
+
 
 class ClaimExtractor:
     """Extracts structured claims from product text"""
     
     def __init__(self):
-        # Performance claim patterns with categories
-        self.claim_patterns = {
-            'battery_capacity': {
-                'patterns': [
-                    r'(\d+)\s*mAh',
-                    r'(\d+)\s*milliamp hour',
-                    r'battery.*?(\d+)\s*mAh',
-                    r'(\d+)\s*[Ww]h(?:our)?',
-                    r'capacity[:\s]+(\d+)\s*mAh',
-                    r'(\d+,\d+)\s*mAh',  # Format like 10,000mAh
-                    r'battery\s+size[:\s]+(\d+)\s*mAh'
-                ],
-                'unit': 'mAh',
-                'keywords': ['battery', 'capacity', 'power bank', 'cell']
-            },
-            'charging_time': {
-                'patterns': [
-                    r'charges?\s+(?:in|within)\s+(\d+)\s*(minutes?|mins?|hours?|hrs?)',
-                    r'(\d+)\s*(minutes?|mins?|hours?|hrs?)\s+(?:fast\s+)?(?:charg(?:e|ing)|to\s+full)',
-                    r'quick\s+charge.*?(\d+)\s*(minutes?|mins?|hours?|hrs?)',
-                    r'full\s+charge.*?(\d+)\s*(hours?|hrs?)',
-                    r'charging\s+time[:\s]+(\d+)\s*(hours?|hrs?|minutes?|mins?)',
-                    r'(?:0|zero)\s*-?\s*(\d+)\s*%\s+(?:in|within)\s+(\d+)\s*(minutes?|mins?)',
-                    r'recharge.*?(?:in|within)\s+(\d+)\s*(hours?|hrs?|minutes?|mins?)',
-                    r'(\d+)\s*(min|hr)\s+(?:charge|charging)'
-                ],
-                'unit': 'time',
-                'keywords': ['charge', 'charging time', 'fast charge', 'full charge', 'recharge']
-            },
-            'power_output': {
-                'patterns': [
-                    r'(\d+\.?\d*)\s*[Ww](?:att)?(?:\s+(?:output|power|charging|fast))?',
-                    r'(\d+\.?\d*)\s*[Ww]\s+(?:fast|quick|rapid|super|hyper)',
-                    r'power.*?(\d+\.?\d*)\s*[Ww]',
-                    r'output[:\s]+(\d+\.?\d*)\s*[Ww]',
-                    r'(\d+\.?\d*)\s*[Ww]\s+(?:Type-?C|USB|PD|QC)'
-                ],
-                'unit': 'W',
-                'keywords': ['power', 'watt', 'output', 'fast charging', 'PD', 'QC']
-            },
-            'speed': {
-                'patterns': [
-                    r'(\d+)\s*(?:mph|km/h|kmph|kilometers?\s+per\s+hour)',
-                    r'top\s+speed.*?(\d+)',
-                    r'speed.*?(\d+)\s*(?:mph|km/h)'
-                ],
-                'unit': 'speed',
-                'keywords': ['speed', 'mph', 'kmph', 'fast']
-            },
-            'range': {
-                'patterns': [
-                    r'(?:range|distance).*?(\d+)\s*(?:km|miles?|kilometers?)',
-                    r'(\d+)\s*(?:km|miles?)\s+range',
-                    r'up\s+to\s+(\d+)\s*(?:km|miles?)'
-                ],
-                'unit': 'distance',
-                'keywords': ['range', 'distance', 'coverage']
-            },
-            'efficiency': {
-                'patterns': [
-                    r'(\d+)%\s+efficien(?:cy|t)',
-                    r'efficien(?:cy|t).*?(\d+)%',
-                    r'(\d+)\s*percent\s+efficient'
-                ],
-                'unit': '%',
-                'keywords': ['efficiency', 'efficient', 'energy saving']
-            },
-            'weight': {
-                'patterns': [
-                    r'(\d+\.?\d*)\s*(?:kg|g|grams?|kilograms?|lbs?|pounds?)',
-                    r'weighs?.*?(\d+\.?\d*)\s*(?:kg|g|lbs?)',
-                    r'(?:ultra|super)?\s*light.*?(\d+\.?\d*)\s*(?:kg|g)'
-                ],
-                'unit': 'weight',
-                'keywords': ['weight', 'lightweight', 'portable']
-            },
-            'capacity_storage': {
-                'patterns': [
-                    r'(\d+)\s*(?:GB|TB|MB)',
-                    r'storage.*?(\d+)\s*(?:GB|TB)',
-                    r'(\d+)\s*(?:liter|litre|L|ml)'
-                ],
-                'unit': 'capacity',
-                'keywords': ['storage', 'capacity', 'memory']
-            },
-            'voltage': {
-                'patterns': [
-                    r'(\d+\.?\d*)\s*[Vv](?:olt)?(?:\s+(?:input|output))?',
-                    r'voltage[:\s]+(\d+\.?\d*)\s*[Vv]',
-                    r'(\d+\.?\d*)\s*[Vv]\s+(?:DC|AC)'
-                ],
-                'unit': 'V',
-                'keywords': ['voltage', 'volt', 'power']
-            },
-            'current': {
-                'patterns': [
-                    r'(\d+\.?\d*)\s*[Aa](?:mp)?(?:\s+(?:input|output))?',
-                    r'current[:\s]+(\d+\.?\d*)\s*[Aa]',
-                    r'(\d+\.?\d*)\s*[Aa]\s+(?:fast|quick)'
-                ],
-                'unit': 'A',
-                'keywords': ['current', 'amp', 'ampere']
-            },
-            'charge_cycles': {
-                'patterns': [
-                    r'(\d+)\+?\s*(?:charge\s+)?cycles?',
-                    r'(?:up\s+to\s+)?(\d+)\s+(?:charge\s+)?cycles?',
-                    r'cycle\s+life[:\s]+(\d+)',
-                    r'lifespan[:\s]+(\d+)\s+cycles?'
-                ],
-                'unit': 'cycles',
-                'keywords': ['cycle', 'lifespan', 'durability']
-            },
-            'warranty': {
-                'patterns': [
-                    r'(\d+)\s*(?:year|month|yr|mo)\s+warranty',
-                    r'warranty[:\s]+(\d+)\s+(?:year|month)',
-                    r'(\d+)\s*(?:year|yr)\s+(?:guarantee|coverage)'
-                ],
-                'unit': 'period',
-                'keywords': ['warranty', 'guarantee', 'coverage']
-            },
-            'temperature': {
-                'patterns': [
-                    r'(?:operating|working)\s+temp.*?([-\d]+)\s*[°]?[CcFf]',
-                    r'([-\d]+)[°]?\s*[Cc]\s+to\s+([-\d]+)[°]?\s*[Cc]',
-                    r'temperature.*?([-\d]+)\s*[°]?[CcFf]'
-                ],
-                'unit': 'temp',
-                'keywords': ['temperature', 'operating temp', 'thermal']
-            },
-            'certifications': {
-                'patterns': [
-                    r'\b(CE|FCC|RoHS|UL|ETL|CSA)\s+certified',
-                    r'\b(ISO\s*\d+)',
-                    r'certified\s+(?:by\s+)?(CE|FCC|RoHS|UL)',
-                    r'\b(MFi|Made\s+for\s+iPhone)'
-                ],
-                'unit': 'certification',
-                'keywords': ['certified', 'certification', 'approved', 'compliant']
-            }
-        }
-        
-        # Marketing buzzwords to flag
-        self.buzzwords = [
-            'AI-powered', 'AI powered', 'artificial intelligence',
-            'medical-grade', 'medical grade', 'hospital grade',
-            'military-grade', 'military grade', 'military spec',
-            'NASA-approved', 'NASA grade', 'space grade',
-            'quantum', 'revolutionary', 'breakthrough', 'patent pending',
-            'miracle', 'magic', 'ultimate', 'absolute',
-            'guaranteed', '100% safe', 'zero risk', 'risk-free',
-            'clinically proven', 'scientifically proven', 'lab tested',
-            'professional grade', 'industrial strength',
-            'never seen before', 'world first', 'industry leading',
-            'unlimited', 'infinite', 'perpetual', 'lifetime',
-            'award winning', 'best in class', '#1 rated'
-        ]
+        # Shared, import-time tables (see the module constants)
+        self.claim_patterns = _CLAIM_PATTERNS
+        self.buzzwords = _BUZZWORDS
     
     def extract_claims(self, product_data: ProductData) -> List[Claim]:
         """
@@ -176,25 +225,33 @@ class ClaimExtractor:
         Returns list of structured claims
         """
         claims = []
-        text = self._prepare_text(product_data)
+        text, text_lower = self._prepare_text(product_data)
         
         # Extract performance claims
         for category, config in self.claim_patterns.items():
+            # Skip the scans when no pattern of the category can match
+            requires = config.get('requires')
+            if requires and not any(literal in text_lower for literal in requires):
+                continue
+            
             category_claims = self._extract_category_claims(
-                text, category, config
+                text, text_lower, category, config
             )
             claims.extend(category_claims)
         
         # Extract buzzword claims
-        buzzword_claims = self._extract_buzzwords(text)
+        buzzword_claims = self._extract_buzzwords(text, text_lower)
         claims.extend(buzzword_claims)
         
-        # Deduplicate claims
-        claims = self._deduplicate_claims(claims)
+        # Claims are deduplicated as they are collected, per category
         return claims
     
-    def _prepare_text(self, product_data: ProductData) -> str:
-        """Combine all product text for analysis"""
+    def _prepare_text(self, product_data: ProductData) -> Tuple[str, str]:
+        """
+        Combine all product text for analysis
+        Returns the text and a lowercased copy of the same length: patterns
+        scan the copy, claim context is cut from the original
+        """
         text_parts = [
             product_data.title,
             product_data.description
@@ -204,99 +261,98 @@ class ClaimExtractor:
         for key, value in product_data.specs.items():
             text_parts.append(f"{key}: {value}")
         
-        return ' '.join(text_parts)
+        text = ' '.join(text_parts)
+        return text, text.translate(_CASE_FOLD).lower()
     
     def _extract_category_claims(
-        self, text: str, category: str, config: Dict
+        self, text: str, text_lower: str, category: str, config: Dict
     ) -> List[Claim]:
         """Extract claims for a specific category"""
         claims = []
+        seen_contexts = set()
+        seen_values = set()
+        unit = config['unit']
+        subunit_last_group = config.get('subunit_last_group', False)
+        text_len = len(text)
         
         for pattern in config['patterns']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text_lower)
             for match in matches:
-                # Extract the full matched text as claim
-                claim_text = match.group(0)
-                
                 # Extract numeric value
                 value = None
                 try:
-                    # Try to get first captured group as value
-                    value_str = match.group(1)
-                    # Handle comma-separated numbers like "10,000"
-                    value_str = value_str.replace(',', '')
-                    value = float(re.sub(r'[^\d.]', '', value_str))
+                    # First captured group; a plain run of digits (the usual
+                    # case) parses as is, anything else is first reduced to
+                    # digits and the point ("10,000", "-20", "iso 9001")
+                    raw = match.group(1)
+                    if not raw.isdecimal():
+                        raw = _NON_NUMERIC_RE.sub('', raw)
+                    value = float(raw)
                 except (IndexError, ValueError):
                     pass
+                subunit = match.group(match.lastindex) if subunit_last_group else None
                 
                 # Get context (surrounding text)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
+                match_start, match_end = match.span()
+                start = max(0, match_start - 50)
+                end = min(text_len, match_end + 50)
+                context = text[start:end].strip()
                 
                 # Don't add duplicate claims with same context
-                if not any(c.text == context.strip() and c.category == category for c in claims):
-                    claims.append(Claim(
-                        text=context.strip(),
-                        category=category,
-                        extracted_value=value,
-                        unit=config['unit']
-                    ))
-        
-        return claims
-    
-    def _extract_buzzwords(self, text: str) -> List[Claim]:
-        """Extract marketing buzzword claims"""
-        claims = []
-        
-        for buzzword in self.buzzwords:
-            pattern = re.compile(r'\b' + re.escape(buzzword) + r'\b', re.IGNORECASE)
-            matches = pattern.finditer(text)
-            
-            for match in matches:
-                # Get surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
+                if context in seen_contexts:
+                    continue
+                seen_contexts.add(context)
                 
-                claims.append(Claim(
-                    text=context.strip(),
-                    category='marketing_buzzword',
-                    extracted_value=None,
-                    unit=None
+                # Nor a second claim with the same category, value and unit
+                # (unit and category are fixed here)
+                if value in seen_values:
+                    continue
+                seen_values.add(value)
+                
+                # Fields are already typed, so skip model validation
+                claims.append(Claim.model_construct(
+                    text=context,
+                    category=category,
+                    extracted_value=value,
+                    unit=unit,
+                    subunit=subunit
                 ))
         
-        # Deduplicate claims
-        claims = self._deduplicate_claims(claims)
         return claims
     
-    def _deduplicate_claims(self, claims: List[Claim]) -> List[Claim]:
-        """Remove duplicate claims based on category and value"""
-        seen = set()
-        unique_claims = []
+    def _extract_buzzwords(self, text: str, text_lower: str) -> List[Claim]:
+        """Extract marketing buzzword claims"""
+        # Buzzword claims carry no value or unit, so all of them share one
+        # deduplication key: only the first in buzzword order is kept
+        hit = min(
+            (
+                (int(match.lastgroup[1:]), match.start(match.lastgroup), match.end(match.lastgroup))
+                for match in _BUZZWORD_RE.finditer(text_lower)
+            ),
+            default=None
+        )
+        if hit is None:
+            return []
         
-        for claim in claims:
-            # Create unique key from category and extracted value
-            key = (claim.category, claim.extracted_value, claim.unit)
-            if key not in seen:
-                seen.add(key)
-                unique_claims.append(claim)
+        # Get surrounding context
+        _, match_start, match_end = hit
+        start = max(0, match_start - 50)
+        end = min(len(text), match_end + 50)
+        context = text[start:end]
         
-        return unique_claims
+        return [Claim.model_construct(
+            text=context.strip(),
+            category='marketing_buzzword',
+            extracted_value=None,
+            unit=None
+        )]
     
-    def _extract_numeric_claims(self, text: str) -> List[Claim]:
+    def _extract_numeric_claims(self, text: str, text_lower: str) -> List[Claim]:
         """Extract comparative claims (2x faster, 50% more, etc.)"""
         claims = []
         
-        patterns = [
-            r'(\d+)x\s+(?:faster|stronger|better|more\s+powerful)',
-            r'(\d+)%\s+(?:faster|stronger|better|more)',
-            r'(?:faster|stronger|better)\s+than.*?(?:competition|others|leading)',
-            r'(?:best|fastest|strongest|most\s+powerful)\s+(?:in|on)\s+(?:market|earth|world)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _COMPARATIVE_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
                 start = max(0, match.start() - 50)
                 end = min(len(text), match.end() + 50)
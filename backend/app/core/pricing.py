@@ -2,9 +2,88 @@
 Pricing intelligence module
 Analyzes product pricing fairness against market benchmarks
 """
+from types import MappingProxyType
 from typing import Dict, Optional, List, Tuple
 from app.models.schemas import PriceAnalysis, ProductData, Claim
 
+# Category keywords in priority order: the first group with a hit wins
+_CATEGORY_KEYWORDS = (
+    ('power_bank', ('power bank', 'powerbank', 'portable charger')),
+    ('charger', ('charger', 'adapter', 'charging')),
+    ('electronics', ('electronics', 'gadget', 'device')),
+)
+
+# Market benchmark database (in USD equivalent)
+_BENCHMARK_SOURCES = {
+    'power_bank': {
+        'price_per_mah': {
+            'budget': 0.001,    # $0.001 per mAh for budget brands
+            'mid_range': 0.0015, # $0.0015 per mAh for mid-range
+            'premium': 0.003,   # $0.003 per mAh for premium brands
+        },
+        'base_price': 8,  # Base manufacturing cost
+        'brand_premium': 1.5,  # 50% brand markup acceptable
+        'typical_range': (10, 80),
+        'fast_charge_premium': 1.2,  # 20% more for fast charging
+        'pd_premium': 1.3,  # 30% more for USB-C PD
+        'wireless_premium': 1.25,  # 25% more for wireless
+        'display_premium': 1.15,  # 15% more for LED display
+    },
+    'charger': {
+        'price_per_watt': {
+            'budget': 0.25,     # $0.25 per watt
+            'mid_range': 0.4,   # $0.40 per watt
+            'premium': 0.7,     # $0.70 per watt (GaN chargers)
+        },
+        'base_price': 5,
+        'brand_premium': 1.4,
+        'typical_range': (10, 60),
+        'gan_premium': 1.4,  # 40% more for GaN technology
+        'multi_port_premium': 1.2,  # 20% more per additional port
+    },
+    'cable': {
+        'base_price': 3,
+        'length_factor': 1.2,  # 20% more per meter
+        'certified_premium': 1.5,  # MFi, USB-IF certified
+        'typical_range': (5, 30),
+    },
+    'battery': {
+        'price_per_mah': 0.002,  # Replacement batteries
+        'base_price': 10,
+        'oem_premium': 2.0,  # OEM vs third-party
+        'typical_range': (15, 100),
+    },
+    'electronics': {
+        'base_price': 20,
+        'brand_premium': 1.5,
+        'typical_range': (30, 500),
+    },
+    'gadget': {
+        'base_price': 15,
+        'brand_premium': 1.4,
+        'typical_range': (20, 300),
+    }
+}
+
+# Per-unit rates are looked up per brand tier; a flat rate applies to all tiers
+_BRAND_TIERS = ('budget', 'mid_range', 'premium')
+
+
+def _with_tiered_rates(benchmark: Dict) -> Dict:
+    """Copy a benchmark with any flat price_per_mah/price_per_watt spread over the brand tiers"""
+    benchmark = dict(benchmark)
+    for key in ('price_per_mah', 'price_per_watt'):
+        rate = benchmark.get(key)
+        if rate is not None and not isinstance(rate, dict):
+            benchmark[key] = dict.fromkeys(_BRAND_TIERS, rate)
+    return benchmark
+
+
+_CATEGORY_BENCHMARKS = MappingProxyType({
+    category: _with_tiered_rates(benchmark)
+    for category, benchmark in _BENCHMARK_SOURCES.items()
+})
+
 
 class PricingEngine:
     """
@@ -21,57 +100,8 @@ class PricingEngine:
             'GBP': 1.27
         }
         
-        # Market benchmark database (in USD equivalent)
-        self.category_benchmarks = {
-            'power_bank': {
-                'price_per_mah': {
-                    'budget': 0.001,    # $0.001 per mAh for budget brands
-                    'mid_range': 0.0015, # $0.0015 per mAh for mid-range
-                    'premium': 0.003,   # $0.003 per mAh for premium brands
-                },
-                'base_price': 8,  # Base manufacturing cost
-                'brand_premium': 1.5,  # 50% brand markup acceptable
-                'typical_range': (10, 80),
-                'fast_charge_premium': 1.2,  # 20% more for fast charging
-                'pd_premium': 1.3,  # 30% more for USB-C PD
-                'wireless_premium': 1.25,  # 25% more for wireless
-                'display_premium': 1.15,  # 15% more for LED display
-            },
-            'charger': {
-                'price_per_watt': {
-                    'budget': 0.25,     # $0.25 per watt
-                    'mid_range': 0.4,   # $0.40 per watt
-                    'premium': 0.7,     # $0.70 per watt (GaN chargers)
-                },
-                'base_price': 5,
-                'brand_premium': 1.4,
-                'typical_range': (10, 60),
-                'gan_premium': 1.4,  # 40% more for GaN technology
-                'multi_port_premium': 1.2,  # 20% more per additional port
-            },
-            'cable': {
-                'base_price': 3,
-                'length_factor': 1.2,  # 20% more per meter
-                'certified_premium': 1.5,  # MFi, USB-IF certified
-                'typical_range': (5, 30),
-            },
-            'battery': {
-                'price_per_mah': 0.002,  # Replacement batteries
-                'base_price': 10,
-                'oem_premium': 2.0,  # OEM vs third-party
-                'typical_range': (15, 100),
-            },
-            'electronics': {
-                'base_price': 20,
-                'brand_premium': 1.5,
-                'typical_range': (30, 500),
-            },
-            'gadget': {
-                'base_price': 15,
-                'brand_premium': 1.4,
-                'typical_range': (20, 300),
-            }
-        }
+        # Market benchmark database (shared, read-only)
+        self.category_benchmarks = _CATEGORY_BENCHMARKS
         
         # Pricing red flags
         self.price_red_flags = {
@@ -136,6 +166,21 @@ class PricingEngine:
             verdict=verdict
         )
     
+    def analyze_prices(
+        self,
+        products: List[ProductData],
+        claims_per_product: List[List[Claim]]
+    ) -> List[Optional[PriceAnalysis]]:
+        """
+        Analyze several products at once
+        Returns one PriceAnalysis (or None) per product, in input order
+        """
+        analyze = self.analyze_price
+        return [
+            analyze(product_data, claims)
+            for product_data, claims in zip(products, claims_per_product)
+        ]
+    
     def _determine_category(
         self, product_data: ProductData, claims: List[Claim]
     ) -> str:
@@ -143,14 +188,11 @@ class PricingEngine:
         text = (product_data.title + ' ' + product_data.description).lower()
         
         # Check for category keywords
-        if any(word in text for word in ['power bank', 'powerbank', 'portable charger']):
-            return 'power_bank'
-        elif any(word in text for word in ['charger', 'adapter', 'charging']):
-            return 'charger'
-        elif any(word in text for word in ['electronics', 'gadget', 'device']):
-            return 'electronics'
-        else:
-            return 'gadget'
+        for category, keywords in _CATEGORY_KEYWORDS:
+            for word in keywords:
+                if word in text:
+                    return category
+        return 'gadget'
     
     def _calculate_fair_price_range(
         self,
@@ -194,59 +236,66 @@ class PricingEngine:
         # Detect brand tier from product text
         brand_tier = 'mid_range'  # default
         
+        # Rates and premiums are the same for every claim: resolve them once
+        is_power_bank = category == 'power_bank'
+        mah_rates = benchmark.get('price_per_mah')
+        mah_rate = mah_rates[brand_tier] if mah_rates else 0.0015
+        if category == 'charger':
+            watt_rates = benchmark.get('price_per_watt')
+            watt_rate = watt_rates[brand_tier] if watt_rates else 0.4
+        else:
+            watt_rate = 0.3
+        fast_charge_premium = benchmark.get('fast_charge_premium')
+        has_fast_charge = None
+        
         for claim in claims:
-            if claim.extracted_value is None:
+            claim_value = claim.extracted_value
+            if claim_value is None:
                 continue
+            claim_category = claim.category
             
             # Power bank capacity pricing
-            if claim.category == 'battery_capacity' and category == 'power_bank':
-                price_per_mah = benchmark.get('price_per_mah', {})
-                if isinstance(price_per_mah, dict):
-                    rate = price_per_mah.get(brand_tier, 0.0015)
-                else:
-                    rate = 0.0015  # fallback for old format
-                value += claim.extracted_value * rate
+            if claim_category == 'battery_capacity' and is_power_bank:
+                value += claim_value * mah_rate
                 
                 # Add premiums for features
-                if 'fast_charge_premium' in benchmark:
-                    # Check if fast charging claimed
-                    has_fast_charge = any(c.category == 'power_output' and c.extracted_value and c.extracted_value > 18 for c in claims)
+                if fast_charge_premium is not None:
+                    # Check if fast charging claimed (once per product)
+                    if has_fast_charge is None:
+                        has_fast_charge = any(c.category == 'power_output' and c.extracted_value and c.extracted_value > 18 for c in claims)
                     if has_fast_charge:
-                        value *= benchmark['fast_charge_premium']
+                        value *= fast_charge_premium
             
             # Power output pricing
-            elif claim.category == 'power_output':
-                if category == 'charger':
-                    price_per_watt = benchmark.get('price_per_watt', {})
-                    if isinstance(price_per_watt, dict):
-                        rate = price_per_watt.get(brand_tier, 0.4)
-                    else:
-                        rate = 0.4
-                    value += claim.extracted_value * rate
-                else:
-                    value += claim.extracted_value * 0.3
+            elif claim_category == 'power_output':
+                value += claim_value * watt_rate
             
             # High efficiency adds value
-            elif claim.category == 'efficiency' and claim.extracted_value > 85:
+            elif claim_category == 'efficiency' and claim_value > 85:
                 value += 5  # Premium for high efficiency
             
             # Fast charging adds value
-            elif claim.category == 'charging_time':
-                if claim.unit == 'time' and claim.extracted_value:
+            elif claim_category == 'charging_time':
+                if claim.unit == 'time' and claim_value:
                     # Extract minutes
-                    minutes = claim.extracted_value
-                    if 'hour' in claim.text.lower():
+                    minutes = claim_value
+                    # Unit captured at extraction; claims built elsewhere fall back to the text
+                    if claim.subunit is not None:
+                        in_hours = claim.subunit.startswith('h')
+                    else:
+                        in_hours = 'hour' in claim.text.lower()
+                    if in_hours:
                         minutes *= 60
                     # Fast charge if under 2 hours (120 min)
                     if minutes < 120:
                         value += 8
             
             # Charge cycles add value
-            elif claim.category == 'charge_cycles' and claim.extracted_value > 500:
+            elif claim_category == 'charge_cycles' and claim_value > 500:
                 value += 5  # Premium for longevity
             
             # Good warranty adds value
-            elif claim.category == 'warranty' and claim.extracted_value >= 12:
+            elif claim_category == 'warranty' and claim_value >= 12:
                 value += 3  # Warranty coverage value
         
         return value
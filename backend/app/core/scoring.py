@@ -1,12 +1,67 @@
 """
 Scoring engine - generates final scores and verdicts
 """
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import List, Tuple
 from app.models.schemas import (
     ClaimVerification, PriceAnalysis, ProductAnalysis,
     Claim, ProductData
 )
 
+# Reality score per verification status; anything else counts as impossible
+_STATUS_SCORES = {
+    'feasible': 100.0,  # Perfect for normal feasible claims
+    'exaggerated': 40.0,  # Penalty for exaggeration
+}
+
+# Feasible claims carrying one of these flags are edge cases
+_EDGE_CASE_FLAGS = ('high_capacity', 'unusually_high')
+
+# Pricing score per price verdict
+_VERDICT_SCORES = MappingProxyType({
+    'suspiciously_cheap': 20.0,  # Possible counterfeit
+    'excellent_value': 100.0,
+    'good_value': 90.0,
+    'fair': 75.0,
+    'slightly_overpriced': 55.0,
+    'overpriced': 30.0,
+    'highly_overpriced': 10.0
+})
+
+# Summary opening per overall verdict
+_VERDICT_MESSAGES = MappingProxyType({
+    'excellent_choice': "Excellent product with realistic claims and great value. Highly recommended.",
+    'good_value': "Good product with realistic claims and fair pricing. Recommended.",
+    'acceptable': "Acceptable product with some valid points but also concerns worth noting.",
+    'overpriced': "Product is significantly overpriced compared to market value.",
+    'misleading_claims': "Product makes several misleading or exaggerated claims. Proceed with caution.",
+    'not_recommended': "Product makes technically impossible claims or has major red flags. Not recommended."
+})
+
+# Fallback messages when nothing more specific applies
+_NO_RED_FLAGS = "✅ No major red flags detected"
+_DEFAULT_RECOMMENDATION = "📊 Product is acceptable but do basic research before purchasing"
+
+# Impossible claims quoted in the red flags
+_MAX_QUOTED_IMPOSSIBLE = 3
+
+
+@dataclass(slots=True)
+class _VerificationStats:
+    """Everything the scoring helpers need from the verifications, gathered in one pass"""
+    count: int = 0
+    total_score: float = 0.0
+    total_weight: float = 0.0
+    critical_flags: int = 0
+    impossible_count: int = 0
+    impossible_head: List[ClaimVerification] = field(default_factory=list)
+    exaggerated_count: int = 0
+    safety_count: int = 0
+    buzzword_count: int = 0
+    certification_count: int = 0
+    warranty_count: int = 0
+
 
 class ScoringEngine:
     """
@@ -22,15 +77,33 @@ class ScoringEngine:
     ) -> ProductAnalysis:
         """Generate complete product analysis with scores and verdict"""
         
+        # Nothing to verify or price: every helper would return its neutral default
+        if not verifications and price_analysis is None:
+            return ProductAnalysis.model_construct(
+                product_title=product_data.title,
+                claims_found=claims,
+                verifications=verifications,
+                price_analysis=None,
+                reality_score=75.0,
+                pricing_score=50.0,
+                overall_verdict='acceptable',
+                summary=_VERDICT_MESSAGES['acceptable'],
+                red_flags=[_NO_RED_FLAGS],
+                recommendations=[_DEFAULT_RECOMMENDATION]
+            )
+        
+        # Walk the verifications once for every helper below
+        stats = self._collect_stats(verifications)
+        
         # Calculate reality score (0-100)
-        reality_score = self._calculate_reality_score(verifications)
+        reality_score = self._calculate_reality_score(stats)
         
         # Calculate pricing score (0-100)
         pricing_score = self._calculate_pricing_score(price_analysis)
         
         # Determine overall verdict
         overall_verdict = self._determine_overall_verdict(
-            reality_score, pricing_score, verifications
+            reality_score, pricing_score, stats
         )
         
         # Generate summary
@@ -39,14 +112,15 @@ class ScoringEngine:
         )
         
         # Extract red flags
-        red_flags = self._extract_red_flags(verifications, price_analysis)
+        red_flags = self._extract_red_flags(stats, price_analysis)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            reality_score, pricing_score, verifications, price_analysis
+            reality_score, pricing_score, stats, price_analysis
         )
         
-        return ProductAnalysis(
+        # Every field is built above from trusted values, so skip validation
+        return ProductAnalysis.model_construct(
             product_title=product_data.title,
             claims_found=claims,
             verifications=verifications,
@@ -59,50 +133,71 @@ class ScoringEngine:
             recommendations=recommendations
         )
     
-    def _calculate_reality_score(
+    def _collect_stats(
         self, verifications: List[ClaimVerification]
-    ) -> float:
-        """
-        Calculate reality score based on claim verifications
-        100 = all claims feasible and realistic
-        0 = all claims impossible or highly exaggerated
-        """
-        if not verifications:
-            return 75.0  # Neutral-positive score if no specific claims to verify
-        
+    ) -> _VerificationStats:
+        """Score, count and sample the verifications in a single pass"""
+        stats = _VerificationStats(count=len(verifications))
         total_score = 0.0
         total_weight = 0.0
         
-        # Count critical flags
-        critical_flags = sum(1 for v in verifications if 'impossible' in v.flags or 'unrealistic' in v.flags)
-        
         for verification in verifications:
+            status = verification.status
+            flags = verification.flags
+            category = verification.category
+            
+            if 'impossible' in flags or 'unrealistic' in flags:
+                stats.critical_flags += 1
+            if 'safety_concern' in flags:
+                stats.safety_count += 1
+            
             # Higher weight for higher confidence
             weight = verification.confidence
             
-            # Score by status with nuance
-            if verification.status == 'feasible':
-                if any(flag in verification.flags for flag in ['high_capacity', 'unusually_high']):
-                    score = 85.0  # Good but not perfect for edge cases
-                else:
-                    score = 100.0  # Perfect for normal feasible claims
-            elif verification.status == 'exaggerated':
-                score = 40.0  # Penalty for exaggeration
-            else:  # impossible
-                score = 0.0  # Zero for impossible claims
+            # Score by status with nuance (zero for impossible claims)
+            score = _STATUS_SCORES.get(status, 0.0)
+            if status == 'feasible' and any(flag in flags for flag in _EDGE_CASE_FLAGS):
+                score = 85.0  # Good but not perfect for edge cases
             
             total_score += score * weight
             total_weight += weight
+            
+            if status == 'impossible':
+                if stats.impossible_count < _MAX_QUOTED_IMPOSSIBLE:
+                    stats.impossible_head.append(verification)
+                stats.impossible_count += 1
+            elif status == 'exaggerated':
+                stats.exaggerated_count += 1
+            
+            if category == 'marketing_buzzword':
+                stats.buzzword_count += 1
+            elif category == 'certifications':
+                stats.certification_count += 1
+            elif category == 'warranty':
+                stats.warranty_count += 1
+        
+        stats.total_score = total_score
+        stats.total_weight = total_weight
+        return stats
+    
+    def _calculate_reality_score(self, stats: _VerificationStats) -> float:
+        """
+        Calculate reality score based on claim verifications
+        100 = all claims feasible and realistic
+        0 = all claims impossible or highly exaggerated
+        """
+        if not stats.count:
+            return 75.0  # Neutral-positive score if no specific claims to verify
         
-        if total_weight == 0:
+        if stats.total_weight == 0:
             return 75.0
         
-        base_score = total_score / total_weight
+        base_score = stats.total_score / stats.total_weight
         
         # Apply penalty for multiple critical issues
-        if critical_flags >= 3:
+        if stats.critical_flags >= 3:
             base_score *= 0.5  # 50% penalty for many impossible claims
-        elif critical_flags >= 2:
+        elif stats.critical_flags >= 2:
             base_score *= 0.7  # 30% penalty
         
         return max(0.0, min(100.0, base_score))
@@ -120,29 +215,19 @@ class ScoringEngine:
             return 50.0  # Neutral if no price data
         
         # More nuanced scoring with suspiciously_cheap detection
-        verdict_scores = {
-            'suspiciously_cheap': 20.0,  # Possible counterfeit
-            'excellent_value': 100.0,
-            'good_value': 90.0,
-            'fair': 75.0,
-            'slightly_overpriced': 55.0,
-            'overpriced': 30.0,
-            'highly_overpriced': 10.0
-        }
-        
-        base_score = verdict_scores.get(price_analysis.verdict, 50.0)
+        base_score = _VERDICT_SCORES.get(price_analysis.verdict, 50.0)
         
         # Adjust based on overpricing percentage
         if price_analysis.overpricing_percentage:
             if price_analysis.overpricing_percentage < -30:  # Extremely cheap
                 # Could be too good to be true
-                base_score = min(85, base_score - 10)
+                base_score = min(85.0, base_score - 10)
             elif price_analysis.overpricing_percentage < -10:  # Good deal
-                base_score = min(100, base_score + 5)
+                base_score = min(100.0, base_score + 5)
             elif price_analysis.overpricing_percentage > 150:  # More than 2.5x fair price
-                base_score = max(0, base_score - 30)
+                base_score = max(0.0, base_score - 30)
             elif price_analysis.overpricing_percentage > 100:  # Double the fair price
-                base_score = max(0, base_score - 20)
+                base_score = max(0.0, base_score - 20)
         
         return base_score
     
@@ -150,24 +235,16 @@ class ScoringEngine:
         self,
         reality_score: float,
         pricing_score: float,
-        verifications: List[ClaimVerification]
+        stats: _VerificationStats
     ) -> str:
         """Determine overall product verdict"""
         
         # Check for impossible claims
-        impossible_count = sum(
-            1 for v in verifications if v.status == 'impossible'
-        )
-        
-        if impossible_count > 0:
+        if stats.impossible_count > 0:
             return 'not_recommended'
         
         # Check for many exaggerated claims
-        exaggerated_count = sum(
-            1 for v in verifications if v.status == 'exaggerated'
-        )
-        
-        if exaggerated_count > len(verifications) * 0.5:  # >50% exaggerated
+        if stats.exaggerated_count > stats.count * 0.5:  # >50% exaggerated
             return 'misleading_claims'
         
         # Combined score evaluation with weighted factors
@@ -196,16 +273,7 @@ class ScoringEngine:
     ) -> str:
         """Generate user-friendly summary"""
         
-        verdict_messages = {
-            'excellent_choice': "Excellent product with realistic claims and great value. Highly recommended.",
-            'good_value': "Good product with realistic claims and fair pricing. Recommended.",
-            'acceptable': "Acceptable product with some valid points but also concerns worth noting.",
-            'overpriced': "Product is significantly overpriced compared to market value.",
-            'misleading_claims': "Product makes several misleading or exaggerated claims. Proceed with caution.",
-            'not_recommended': "Product makes technically impossible claims or has major red flags. Not recommended."
-        }
-        
-        base_message = verdict_messages.get(
+        base_message = _VERDICT_MESSAGES.get(
             verdict,
             "Product has mixed characteristics requiring careful consideration."
         )
@@ -227,31 +295,32 @@ class ScoringEngine:
     
     def _extract_red_flags(
         self,
-        verifications: List[ClaimVerification],
+        stats: _VerificationStats,
         price_analysis: PriceAnalysis | None
     ) -> List[str]:
         """Extract red flags for user attention"""
         red_flags = []
         
-        # Check for impossible claims with details
-        impossible_claims = [v for v in verifications if v.status == 'impossible']
-        for verification in impossible_claims[:3]:  # Limit to top 3
+        # Check for impossible claims with details (top 3 only)
+        for verification in stats.impossible_head:
             red_flags.append(
                 f"❌ Impossible claim: {verification.claim[:80]}... ({verification.reasoning[:60]})"
             )
         
-        if len(impossible_claims) > 3:
-            red_flags.append(f"❌ Plus {len(impossible_claims) - 3} more impossible claims")
+        if stats.impossible_count > _MAX_QUOTED_IMPOSSIBLE:
+            red_flags.append(
+                f"❌ Plus {stats.impossible_count - _MAX_QUOTED_IMPOSSIBLE} more impossible claims"
+            )
         
         # Check for exaggerated claims
-        exaggerated = [v for v in verifications if v.status == 'exaggerated']
-        if len(exaggerated) >= 4:
+        exaggerated_count = stats.exaggerated_count
+        if exaggerated_count >= 4:
             red_flags.append(
-                f"⚠️ Multiple exaggerated claims detected ({len(exaggerated)} found) - marketing hype likely"
+                f"⚠️ Multiple exaggerated claims detected ({exaggerated_count} found) - marketing hype likely"
             )
-        elif len(exaggerated) >= 2:
+        elif exaggerated_count >= 2:
             red_flags.append(
-                f"⚠️ Some claims appear exaggerated ({len(exaggerated)} found)"
+                f"⚠️ Some claims appear exaggerated ({exaggerated_count} found)"
             )
         
         # Price red flags with more context
@@ -270,21 +339,19 @@ class ScoringEngine:
                 )
         
         # Safety concerns from flags
-        safety_issues = [v for v in verifications if 'safety_concern' in v.flags]
-        if safety_issues:
+        if stats.safety_count:
             red_flags.append(
                 "⚡ Safety concerns detected - verify certifications and user reviews"
             )
         
         # Buzzword overuse
-        buzzwords = [v for v in verifications if v.category == 'marketing_buzzword']
-        if len(buzzwords) > 3:
+        if stats.buzzword_count > 3:
             red_flags.append(
                 "📢 Heavy use of marketing buzzwords without substantiation"
             )
         
         if not red_flags:
-            red_flags.append("✅ No major red flags detected")
+            red_flags.append(_NO_RED_FLAGS)
         
         return red_flags
     
@@ -292,7 +359,7 @@ class ScoringEngine:
         self,
         reality_score: float,
         pricing_score: float,
-        verifications: List[ClaimVerification],
+        stats: _VerificationStats,
         price_analysis: PriceAnalysis | None
     ) -> List[str]:
         """Generate actionable recommendations"""
@@ -337,22 +404,20 @@ class ScoringEngine:
                 )
         
         # Specific claim recommendations
-        impossible = [v for v in verifications if v.status == 'impossible']
-        if impossible:
+        impossible_count = stats.impossible_count
+        if impossible_count:
             recommendations.append(
-                f"❌ Avoid products with {len(impossible)} impossible claim(s) - indicates dishonest marketing"
+                f"❌ Avoid products with {impossible_count} impossible claim(s) - indicates dishonest marketing"
             )
         
         # Certification recommendations
-        cert_claims = [v for v in verifications if v.category == 'certifications']
-        if cert_claims:
+        if stats.certification_count:
             recommendations.append(
                 "🏅 Verify certifications on official regulatory websites (FCC, CE, etc.)"
             )
         
         # Warranty recommendations
-        warranty_claims = [v for v in verifications if v.category == 'warranty']
-        if warranty_claims:
+        if stats.warranty_count:
             recommendations.append(
                 "📄 Read warranty terms carefully - check coverage limits and claim process"
             )
@@ -367,24 +432,6 @@ class ScoringEngine:
             )
         
         if not recommendations:
-            recommendations.append(
-                "📊 Product is acceptable but do basic research before purchasing"
-            )
-        
-        return recommendations
-        if impossible:
-            recommendations.append(
-                "🚫 Avoid this product - impossible claims indicate unreliable seller"
-            )
-        
-        # General recommendations
-        if reality_score >= 75 and pricing_score >= 70:
-            recommendations.append(
-                "✨ This product appears legitimate - read user reviews to confirm"
-            )
-        else:
-            recommendations.append(
-                "🔎 Research competitor products before making decision"
-            )
+            recommendations.append(_DEFAULT_RECOMMENDATION)
         
         return recommendations
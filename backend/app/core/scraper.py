@@ -2,11 +2,177 @@
 Product data scraper and parser
 Extracts product information from URLs or raw text
 """
+import os
 import re
-from typing import Dict, Any, Optional
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Union
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from app.models.schemas import ProductData
+from app.utils.html_parsing import (
+    compile_selectors, find_json_ld_product, make_soup, select_grouped
+)
+
+# Fallback fetch tuning (override via environment)
+MAX_PAGE_BYTES = int(os.getenv('SCRAPER_MAX_PAGE_BYTES', str(2 * 1024 * 1024)))  # Body bytes read per page
+READ_CHUNK_BYTES = 64 * 1024
+
+# Successful URL scrapes, reused briefly by retries and repeat lookups
+SCRAPE_CACHE_TTL = 300  # seconds
+SCRAPE_CACHE_MAX = 100
+
+# One pooled session for the fallback fetcher, so repeat hosts reuse connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# An amount, matched without backtracking into it: re has no possessive
+# quantifiers or atomic groups before Python 3.11, so a lookahead captures the
+# greedy match and the backreference consumes exactly that (always group 1).
+_AMOUNT = r'(?=([0-9,]+\.?[0-9]*))\1'
+
+# Price patterns like $99.99, 99.99, ₹999, etc., most specific first.
+# Amounts never give digits back and the suffixed amount only starts at the
+# beginning of a run: giving digits back can never produce a match, so this
+# keeps every result while making long digit runs linear instead of cubic.
+_PRICE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'₹\s*' + _AMOUNT,  # Indian Rupee first
+    r'Rs\.?\s*' + _AMOUNT,  # Rs. format
+    r'INR\s*' + _AMOUNT,  # INR prefix
+    r'MRP[:\s]*₹?\s*' + _AMOUNT,  # MRP format
+    r'Price[:\s]*₹?\s*' + _AMOUNT,  # Price: format
+    r'\$\s*' + _AMOUNT,  # Dollar
+    r'[\€£¥]\s*' + _AMOUNT,  # Other currencies
+    r'(?<![0-9,])' + _AMOUNT + r'\s*(?:INR|USD|EUR|GBP|rupees?|dollars?)',
+    r'(?:Price|price|Cost:|cost:|MRP|mrp)[:\s]*[₹\$€£¥]?\s*' + _AMOUNT,
+    r'\b([0-9]{2,6})\b'  # Plain numbers 99-999999
+))
+
+# Common spec patterns in plain text, as (number, unit) pairs.
+# Every pattern starts at a digit run, so one scan stops at each run followed
+# by a possible unit letter (keep the class in sync with the units) and tries
+# all patterns there as optional lookaheads: several can match at one run,
+# e.g. "25 km/h" is both speed and range. Numbers are matched without
+# backtracking, as for prices.
+_TEXT_SPEC_PATTERNS = {
+    'battery': (r'\d+', r'\s*mAh'),
+    'power': (r'\d+', r'\s*[Ww]att?s?'),
+    'voltage': (r'\d+\.?\d*', r'\s*[Vv]olt?s?'),
+    'current': (r'\d+\.?\d*', r'\s*[Aa]mp?s?'),
+    'speed': (r'\d+', r'\s*(?:mph|km/h|kmph)'),
+    'range': (r'\d+', r'\s*(?:km|miles?|meters?|metre?s?)'),
+    'capacity': (r'\d+', r'\s*(?:GB|TB|MB|L|ml|liters?|litres?)'),
+    'weight': (r'\d+\.?\d*', r'\s*(?:kg|g|grams?|lbs?|oz|ounce)'),
+    'charging_time': (r'\d+\.?\d*', r'\s*(?:hour|hr|minute|min)s?\s*(?:charge|charging)?'),
+    'output': (r'\d+\.?\d*', r'\s*[Ww]\s*output'),
+}
+# Group 1 is the digit run guard, so a match with lastindex 1 found no spec
+_TEXT_SPEC_RE = re.compile(
+    r'(?<!\d)(?=(?=(\d+\.?\d*))\1\s*[mwvakgtlho])'
+    + ''.join(
+        f'(?:(?=(?P<{name}>(?=(?P<{name}_n>{number}))(?P={name}_n){unit})))?'
+        for name, (number, unit) in _TEXT_SPEC_PATTERNS.items()
+    ),
+    re.IGNORECASE
+)
+
+_WS_RE = re.compile(r'\s+')
+_SPEC_CLASS_RE = re.compile(r'spec|feature|detail')
+
+# Currency markers in priority order, checked against lowercased text.
+# Plain substring checks: a regex alternation over the same markers measured
+# several times slower on page-sized text ('euro' is covered by 'eur').
+_CURRENCY_MARKERS = (
+    ('INR', ('₹', 'inr', 'rupee', 'rs.', 'rs ')),
+    ('EUR', ('€', 'eur')),
+    ('GBP', ('£', 'gbp', 'pound')),
+    ('USD', ('$', 'usd', 'dollar')),
+)
+
+# CSS selectors per field, most specific first
+_TITLE_SELECTORS = compile_selectors([
+    'h1[id*="title"]',
+    'h1[id*="productTitle"]',
+    'h1.product-title',
+    'h1[class*="product"]',
+    '[data-testid="product-title"]',
+    'h1[class*="title"]',
+    '.product-name h1',
+    '#product-title',
+    'h1'
+])
+_DESCRIPTION_SELECTORS = compile_selectors([
+    '[id*="description"]',
+    '[class*="description"]',
+    '[data-testid*="description"]',
+    'div.product-details',
+    '[id*="feature"]',
+    '[class*="feature"]',
+    '.product-description',
+    '#product-description'
+])
+_PRICE_SELECTORS = compile_selectors([
+    '[class*="price"]',
+    '[id*="price"]',
+    '[data-testid*="price"]',
+    '.price-current',
+    '#priceblock_ourprice',
+    '#priceblock_dealprice',
+    '.a-price .a-offscreen',
+    'span.price'
+])
+
+# Demo products based on URL patterns, built once and shared (never mutated)
+_DEMO_PRODUCTS = MappingProxyType({
+    'realistic': ProductData(
+        title="Portable 10000mAh Power Bank",
+        description="Compact 10000mAh portable charger with 18W fast charging support. Dual USB ports allow charging two devices simultaneously. Built-in safety features protect against overcharging. Lightweight design at 200g. Fully charges in 4 hours.",
+        price=39.99,
+        currency="USD",
+        specs={'battery': '10000mAh', 'power': '18W', 'weight': '200g'},
+        raw_text="Portable 10000mAh Power Bank. 18W fast charging. Dual USB ports. 200g lightweight. Charges in 4 hours. Price: $39.99"
+    ),
+    'unrealistic': ProductData(
+        title="Quantum AI Power Bank 50000mAh",
+        description="Revolutionary 50000mAh quantum battery with AI-powered charging. Charges any phone in just 3 minutes! 200W ultra-fast output. 100% efficiency guaranteed. Military-grade durability. Medical-grade safety certified.",
+        price=199.99,
+        currency="USD",
+        specs={'battery': '50000mAh', 'power': '200W'},
+        raw_text="Quantum AI Power Bank 50000mAh. Charges in 3 minutes. 200W output. 100% efficiency. Military-grade. Medical-grade. Price: $199.99"
+    )
+})
+
+_scrape_cache: "OrderedDict[str, Tuple[ProductData, float]]" = OrderedDict()
+_scrape_cache_lock = threading.Lock()  # Scrapes run in worker threads
+
+
+def _scrape_cache_get(url: str) -> Optional[ProductData]:
+    """Return the cached scrape for this URL, if it has not expired"""
+    with _scrape_cache_lock:
+        entry = _scrape_cache.get(url)
+        if entry is None:
+            return None
+        product, expires = entry
+        if time.monotonic() >= expires:
+            del _scrape_cache[url]
+            return None
+        return product
+
+
+def _scrape_cache_put(url: str, product: ProductData) -> None:
+    """Remember a successful scrape for SCRAPE_CACHE_TTL seconds"""
+    with _scrape_cache_lock:
+        _scrape_cache[url] = (product, time.monotonic() + SCRAPE_CACHE_TTL)
+        _scrape_cache.move_to_end(url)
+        if len(_scrape_cache) > SCRAPE_CACHE_MAX:
+            _scrape_cache.popitem(last=False)
 
 
 class ProductScraper:
@@ -23,15 +189,27 @@ class ProductScraper:
         }
         self.timeout = 15
     
-    def extract_from_url(self, url: str) -> ProductData:
+    def extract_from_url(self, url: str, force: bool = False) -> ProductData:
         """
         Extract product data from URL
         Uses browser automation for better success rate
+        Recent successful scrapes are reused unless force is set
         """
         # For demo URLs, return example data
         if 'example.com' in url or 'demo' in url.lower():
             return self._create_demo_product(url)
         
+        if not force:
+            cached = _scrape_cache_get(url)
+            if cached is not None:
+                return cached
+        
+        product = self._scrape_url(url)
+        _scrape_cache_put(url, product)
+        return product
+    
+    def _scrape_url(self, url: str) -> ProductData:
+        """Scrape a real URL with the browser, falling back to plain requests"""
         # Try browser-based scraping for real URLs
         try:
             from app.core.browser_scraper import extract_from_url_sync
@@ -55,6 +233,48 @@ class ProductScraper:
                     f"Please copy the product details (title, price, features) and use text input mode instead."
                 )
     
+    async def extract_many(self, urls: List[str]) -> List[Union[ProductData, Exception]]:
+        """
+        Extract product data for several URLs concurrently
+        Real URLs share one browser; failed items are returned as exceptions
+        """
+        results: List[Union[ProductData, Exception, None]] = [None] * len(urls)
+        pending = []
+        
+        for i, url in enumerate(urls):
+            if 'example.com' in url or 'demo' in url.lower():
+                results[i] = self._create_demo_product(url)
+                continue
+            results[i] = _scrape_cache_get(url)
+            if results[i] is None:
+                pending.append(i)
+        
+        if not pending:
+            return results
+        
+        try:
+            from app.core.browser_scraper import BrowserScraper, on_scraper_loop
+            scraped = await on_scraper_loop(
+                BrowserScraper().extract_many([urls[i] for i in pending])
+            )
+        except ImportError:
+            # Playwright not installed, use fallback for every URL
+            scraped = [ImportError()] * len(pending)
+        
+        for i, result in zip(pending, scraped):
+            if isinstance(result, ProductData) or isinstance(result, ValueError):
+                # Keep data and user-friendly errors as-is
+                results[i] = result
+            else:
+                try:
+                    results[i] = await asyncio.to_thread(self._extract_with_requests, urls[i])
+                except Exception as e:
+                    results[i] = e
+            if isinstance(results[i], ProductData):
+                _scrape_cache_put(urls[i], results[i])
+        
+        return results
+    
     def _extract_with_requests(self, url: str) -> ProductData:
         """
         Extract product data from URL
@@ -66,30 +286,33 @@ class ProductScraper:
             return self._create_demo_product(url)
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            with _SESSION.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                body = self._read_body(response)
+            soup = make_soup(body)
             
             # Try multiple extraction strategies
             title = self._extract_title(soup) or self._extract_meta_title(soup)
+            
+            # If we got minimal data, try structured data (before scripts are stripped)
+            if title == "Unknown Product":
+                title = self._extract_from_json_ld(soup) or title
+            
             description = self._extract_description(soup) or self._extract_meta_description(soup)
-            price = self._extract_price(soup)
             specs = self._extract_specs(soup)
             
-            # Get more text content for claim extraction
+            # Strip scripts and styles once; the clean text serves price and currency
             raw_text = self._get_clean_text(soup)
-            
-            # If we got minimal data, try to extract from meta tags and structured data
-            if title == "Unknown Product":
-                title = self._extract_from_json_ld(soup) or title
+            price = self._extract_price(soup, raw_text)
             
             # Combine all text for better claim extraction
-            full_text = f"{title}. {description}. {raw_text}"
+            full_text = f"{title}. {description}. {raw_text[:5000]}"
             
             # Detect currency from text
-            currency = self._detect_currency(soup.get_text(), price)
+            currency = self._detect_currency(raw_text, price)
             
-            return ProductData(
+            # Every field is already the declared type; skip re-validation
+            return ProductData.model_construct(
                 title=title,
                 description=description or "No description available",
                 price=price,
@@ -131,6 +354,29 @@ class ProductScraper:
                 "Please switch to text input mode and paste the product details directly."
             )
     
+    def _read_body(self, response: requests.Response) -> str:
+        """
+        Read at most MAX_PAGE_BYTES of a streamed response
+        Decodes the way response.text does, guessing on the capped bytes only
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(READ_CHUNK_BYTES):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_PAGE_BYTES:
+                break
+        body = b''.join(chunks)[:MAX_PAGE_BYTES]
+        
+        encoding = response.encoding
+        if encoding is None:
+            encoding = chardet.detect(body)['encoding']
+        try:
+            return str(body, encoding, errors='replace')
+        except (LookupError, TypeError):
+            # Unknown charset name, or nothing could be guessed
+            return str(body, errors='replace')
+    
     def extract_from_text(self, text: str) -> ProductData:
         """
         Extract product data from plain text description with validation
@@ -158,7 +404,7 @@ class ProductScraper:
         # Detect currency from text
         currency = self._detect_currency(text, price)
         
-        return ProductData(
+        return ProductData.model_construct(
             title=title.strip(),
             description=text,
             price=price,
@@ -169,23 +415,10 @@ class ProductScraper:
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract product title from HTML"""
-        # Try common title patterns
-        selectors = [
-            'h1[id*="title"]',
-            'h1[id*="productTitle"]',
-            'h1.product-title',
-            'h1[class*="product"]',
-            '[data-testid="product-title"]',
-            'h1[class*="title"]',
-            '.product-name h1',
-            '#product-title',
-            'h1'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
+        # Try common title patterns, one tree walk for all of them
+        for elements in select_grouped(soup, _TITLE_SELECTORS):
+            if elements:
+                text = elements[0].get_text(strip=True)
                 if len(text) > 10:  # Ensure it's substantial
                     return text
         
@@ -210,24 +443,17 @@ class ProductScraper:
     
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract product description"""
-        selectors = [
-            '[id*="description"]',
-            '[class*="description"]',
-            '[data-testid*="description"]',
-            'div.product-details',
-            '[id*="feature"]',
-            '[class*="feature"]',
-            '.product-description',
-            '#product-description'
-        ]
-        
         descriptions = []
-        for selector in selectors:
-            elements = soup.select(selector)
+        length = -1  # Joined length; the first join adds no separator
+        for elements in select_grouped(soup, _DESCRIPTION_SELECTORS):
             for element in elements[:3]:  # Get up to 3 description elements
                 text = element.get_text(strip=True)
                 if len(text) > 20:
                     descriptions.append(text)
+                    length += len(text) + 1
+            # Later matches would only land past the 1000-char cut
+            if length >= 1000:
+                break
         
         if descriptions:
             return ' '.join(descriptions)[:1000]
@@ -251,21 +477,9 @@ class ProductScraper:
         
         return ""
     
-    def _extract_price(self, soup: BeautifulSoup) -> Optional[float]:
+    def _extract_price(self, soup: BeautifulSoup, page_text: str) -> Optional[float]:
         """Extract price from HTML"""
-        selectors = [
-            '[class*="price"]',
-            '[id*="price"]',
-            '[data-testid*="price"]',
-            '.price-current',
-            '#priceblock_ourprice',
-            '#priceblock_dealprice',
-            '.a-price .a-offscreen',
-            'span.price'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
+        for elements in select_grouped(soup, _PRICE_SELECTORS):
             for element in elements:
                 price_text = element.get_text(strip=True)
                 price = self._extract_price_from_text(price_text)
@@ -273,7 +487,6 @@ class ProductScraper:
                     return price
         
         # Try to find price in page text
-        page_text = soup.get_text()
         return self._extract_price_from_text(page_text)
     
     def _detect_currency(self, text: str, price: Optional[float]) -> str:
@@ -284,14 +497,10 @@ class ProductScraper:
         text_lower = text.lower()
         
         # Check for explicit currency indicators
-        if '₹' in text or 'inr' in text_lower or 'rupee' in text_lower or 'rs.' in text_lower or 'rs ' in text_lower:
-            return "INR"
-        elif '€' in text or 'eur' in text_lower or 'euro' in text_lower:
-            return "EUR"
-        elif '£' in text or 'gbp' in text_lower or 'pound' in text_lower:
-            return "GBP"
-        elif '$' in text or 'usd' in text_lower or 'dollar' in text_lower:
-            return "USD"
+        for currency, markers in _CURRENCY_MARKERS:
+            for marker in markers:
+                if marker in text_lower:
+                    return currency
         
         # Heuristic: Indian prices are typically higher numbers without decimals
         if price > 500 and '.' not in str(price):
@@ -304,21 +513,8 @@ class ProductScraper:
     def _extract_price_from_text(self, text: str) -> Optional[float]:
         """Extract numeric price from text"""
         # Match patterns like $99.99, 99.99, ₹999, etc.
-        patterns = [
-            r'₹\s*([0-9,]+\.?[0-9]*)',  # Indian Rupee first
-            r'Rs\.?\s*([0-9,]+\.?[0-9]*)',  # Rs. format
-            r'INR\s*([0-9,]+\.?[0-9]*)',  # INR prefix
-            r'MRP[:\s]*₹?\s*([0-9,]+\.?[0-9]*)',  # MRP format
-            r'Price[:\s]*₹?\s*([0-9,]+\.?[0-9]*)',  # Price: format
-            r'\$\s*([0-9,]+\.?[0-9]*)',  # Dollar
-            r'[\€£¥]\s*([0-9,]+\.?[0-9]*)',  # Other currencies
-            r'([0-9,]+\.?[0-9]*)\s*(?:INR|USD|EUR|GBP|rupees?|dollars?)',
-            r'(?:Price|price|Cost:|cost:|MRP|mrp)[:\s]*[₹\$€£¥]?\s*([0-9,]+\.?[0-9]*)',
-            r'\b([0-9]{2,6})\b'  # Plain numbers 99-999999
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 price_str = match.group(1).replace(',', '').replace('\u00a0', '')  # Remove commas and nbsp
                 try:
@@ -336,7 +532,7 @@ class ProductScraper:
         specs = {}
         
         # Look for spec tables
-        spec_tables = soup.find_all(['table', 'ul'], class_=re.compile(r'spec|feature|detail'))
+        spec_tables = soup.find_all(['table', 'ul'], class_=_SPEC_CLASS_RE)
         
         for table in spec_tables:
             rows = table.find_all(['tr', 'li'])
@@ -356,25 +552,21 @@ class ProductScraper:
         """Extract specs from plain text"""
         specs = {}
         
-        # Extract common patterns
-        patterns = {
-            'battery': r'(\d+)\s*mAh',
-            'power': r'(\d+)\s*[Ww]att?s?',
-            'voltage': r'(\d+\.?\d*)\s*[Vv]olt?s?',
-            'current': r'(\d+\.?\d*)\s*[Aa]mp?s?',
-            'speed': r'(\d+)\s*(?:mph|km/h|kmph)',
-            'range': r'(\d+)\s*(?:km|miles?|meters?|metre?s?)',
-            'capacity': r'(\d+)\s*(?:GB|TB|MB|L|ml|liters?|litres?)',
-            'weight': r'(\d+\.?\d*)\s*(?:kg|g|grams?|lbs?|oz|ounce)',
-            'charging_time': r'(\d+\.?\d*)\s*(?:hour|hr|minute|min)s?\s*(?:charge|charging)?',
-            'output': r'(\d+\.?\d*)\s*[Ww]\s*output',
-        }
+        # Extract common patterns in one scan, keeping the first hit of each
+        found = {}
+        for match in _TEXT_SPEC_RE.finditer(text.lower()):
+            if match.lastindex == 1:
+                continue
+            for spec_name in _TEXT_SPEC_PATTERNS:
+                if spec_name not in found and match.group(spec_name) is not None:
+                    found[spec_name] = match.group(spec_name)
+            if len(found) == len(_TEXT_SPEC_PATTERNS):
+                break
         
-        text_lower = text.lower()
-        for spec_name, pattern in patterns.items():
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                specs[spec_name] = match.group(0)
+        # Keep the pattern order for the specs dict
+        for spec_name in _TEXT_SPEC_PATTERNS:
+            if spec_name in found:
+                specs[spec_name] = found[spec_name]
         
         return specs
     
@@ -384,58 +576,21 @@ class ProductScraper:
         for script in soup(["script", "style"]):
             script.decompose()
         
-        # Get text and clean it up
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text[:5000]  # Limit to first 5000 chars
+        # Collapse every whitespace run to one space
+        return _WS_RE.sub(' ', soup.get_text()).strip()
     
     def _extract_from_json_ld(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract product info from JSON-LD structured data"""
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            try:
-                import json
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    # Handle single object
-                    if data.get('@type') == 'Product':
-                        return data.get('name', '')
-                elif isinstance(data, list):
-                    # Handle array of objects
-                    for item in data:
-                        if isinstance(item, dict) and item.get('@type') == 'Product':
-                            return item.get('name', '')
-            except:
-                continue
-        return None
+        """Extract product name from JSON-LD structured data"""
+        node = find_json_ld_product(soup)
+        if node is None:
+            return None
+        name = node.get('name', '')
+        return name if isinstance(name, str) else ''
     
     def _create_demo_product(self, url: str) -> ProductData:
         """Create demo product data for testing"""
-        # Demo products based on URL patterns
-        demo_products = {
-            'realistic': ProductData(
-                title="Portable 10000mAh Power Bank",
-                description="Compact 10000mAh portable charger with 18W fast charging support. Dual USB ports allow charging two devices simultaneously. Built-in safety features protect against overcharging. Lightweight design at 200g. Fully charges in 4 hours.",
-                price=39.99,
-                currency="USD",
-                specs={'battery': '10000mAh', 'power': '18W', 'weight': '200g'},
-                raw_text="Portable 10000mAh Power Bank. 18W fast charging. Dual USB ports. 200g lightweight. Charges in 4 hours. Price: $39.99"
-            ),
-            'unrealistic': ProductData(
-                title="Quantum AI Power Bank 50000mAh",
-                description="Revolutionary 50000mAh quantum battery with AI-powered charging. Charges any phone in just 3 minutes! 200W ultra-fast output. 100% efficiency guaranteed. Military-grade durability. Medical-grade safety certified.",
-                price=199.99,
-                currency="USD",
-                specs={'battery': '50000mAh', 'power': '200W'},
-                raw_text="Quantum AI Power Bank 50000mAh. Charges in 3 minutes. 200W output. 100% efficiency. Military-grade. Medical-grade. Price: $199.99"
-            )
-        }
-        
         # Choose demo based on URL content
         if 'unrealistic' in url.lower() or 'bad' in url.lower():
-            return demo_products['unrealistic']
+            return _DEMO_PRODUCTS['unrealistic']
         else:
-            return demo_products['realistic']
+            return _DEMO_PRODUCTS['realistic']
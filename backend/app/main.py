@@ -2,6 +2,7 @@
 FastAPI application entry point
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
 
@@ -11,7 +12,8 @@ app = FastAPI(
     description="AI-powered Product Reality & Fair Price Checker",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for frontend access
@@ -19,8 +21,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify exact origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],  # The API only exposes GET and POST routes
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=3600,  # Let browsers reuse a preflight for an hour
 )
 
 # Include API routes
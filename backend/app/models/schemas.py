@@ -2,7 +2,7 @@
 Pydantic models for request/response validation
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProductInput(BaseModel):
@@ -10,17 +10,20 @@ class ProductInput(BaseModel):
     url: Optional[str] = None
     text: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com/product/xyz",
                 "text": "10000mAh power bank that charges in 5 minutes"
             }
         }
+    )
 
 
 class ProductData(BaseModel):
-    """Extracted product information"""
+    """Extracted product information (frozen: scrapes are cached and shared)"""
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     description: str
     price: Optional[float] = None
@@ -35,11 +38,13 @@ class Claim(BaseModel):
     category: str  # power, capacity, speed, range, efficiency, etc.
     extracted_value: Optional[float] = None
     unit: Optional[str] = None
+    subunit: Optional[str] = None  # unit as written, e.g. 'hours' or 'min' for charging time
 
 
 class ClaimVerification(BaseModel):
     """Verification result for a single claim"""
     claim: str
+    category: Optional[str] = None  # Category of the verified claim
     status: str  # feasible, exaggerated, impossible
     confidence: float  # 0-1
     reasoning: str
@@ -71,6 +76,12 @@ class ProductAnalysis(BaseModel):
     recommendations: List[str]
 
 
+class BatchAnalysisItem(BaseModel):
+    """Result for one product of a batch analysis"""
+    analysis: Optional[ProductAnalysis] = None
+    error: Optional[str] = None
+
+
 class HealthCheck(BaseModel):
     """API health check response"""
     status: str
@@ -0,0 +1,71 @@
+"""
+HTML parsing helpers shared by the scrapers
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+
+def make_soup(content: str) -> BeautifulSoup:
+    """Parse HTML with the C-backed lxml parser, falling back to html.parser"""
+    try:
+        return BeautifulSoup(content, 'lxml')
+    except Exception:
+        # lxml not installed (FeatureNotFound) or choked on malformed markup
+        return BeautifulSoup(content, 'html.parser')
+
+
+def compile_selectors(selectors: List[str]) -> Tuple[Any, List[Any]]:
+    """Precompile a field's selectors plus one combined selector for a single tree walk"""
+    return (
+        soupsieve.compile(', '.join(selectors)),
+        [soupsieve.compile(selector) for selector in selectors]
+    )
+
+
+def select_grouped(soup: BeautifulSoup, selectors: Tuple[Any, List[Any]]) -> Iterator[List[Tag]]:
+    """
+    Walk the tree once and bucket matches per selector
+    Each bucket equals soup.select(selector), yielded lazily in selector
+    priority order so callers that stop early skip the remaining selectors
+    """
+    combined, patterns = selectors
+    candidates = combined.select(soup)
+    for pattern in patterns:
+        yield [el for el in candidates if pattern.match(el)]
+
+
+def _is_product(item: Any) -> bool:
+    """Check a JSON-LD node is a schema.org Product"""
+    if not isinstance(item, dict):
+        return False
+    node_type = item.get('@type')
+    return node_type == 'Product' or (isinstance(node_type, list) and 'Product' in node_type)
+
+
+def find_json_ld_product(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    """
+    Return the first Product node from the page's JSON-LD blocks (incl. @graph)
+    Blocks that never mention "Product" (breadcrumbs, site search) are not parsed
+    """
+    for script in soup.find_all('script', type='application/ld+json'):
+        text = script.string
+        if not text or '"Product"' not in text:
+            continue
+        try:
+            # orjson only takes exact str, not bs4's NavigableString subclass
+            data = orjson.loads(str(text))
+        except orjson.JSONDecodeError:
+            continue
+        
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get('@graph'), list):
+                nodes = item['@graph']
+            else:
+                nodes = [item]
+            for node in nodes:
+                if _is_product(node):
+                    return node
+    return None